@@ -1,4 +1,5 @@
 import streamlit as st
+from utils.page_router import show_page
 from utils.session_state import init_session_state
 from utils.simple_auth import check_password
 
@@ -17,38 +18,11 @@ init_session_state()
 if not check_password():
     st.stop()
 
-# Import pages after authentication
-from pages.persona_selection import show_persona_selection
-from pages.welcome import show_welcome
-from pages.riasec_assessment import show_riasec_assessment
-from pages.skills_assessment import show_skills_assessment
-from pages.values_assessment import show_values_assessment
-from pages.results import show_results
-from pages.coaching_dashboard import show_coaching_dashboard
-from pages.manager_dashboard import show_manager_dashboard
-from pages.admin_panel import show_admin_panel
-
 # Main app logic
 def main():
-    # Handle navigation based on current step
-    if st.session_state.current_step == 'persona':
-        show_persona_selection()
-    elif st.session_state.current_step == 'welcome':
-        show_welcome()
-    elif st.session_state.current_step == 'riasec':
-        show_riasec_assessment()
-    elif st.session_state.current_step == 'skills':
-        show_skills_assessment()
-    elif st.session_state.current_step == 'values':
-        show_values_assessment()
-    elif st.session_state.current_step == 'results':
-        show_results()
-    elif st.session_state.current_step == 'coaching':
-        show_coaching_dashboard()
-    elif st.session_state.current_step == 'manager':
-        show_manager_dashboard()
-    elif st.session_state.current_step == 'admin':
-        show_admin_panel()
+    # Handle navigation based on current step; each page module is imported
+    # the first time its step is shown (see utils.page_router)
+    show_page(st.session_state.current_step)
 
 if __name__ == "__main__":
     main()
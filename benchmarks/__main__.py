@@ -0,0 +1,135 @@
+"""Run the benchmarks: python -m benchmarks [--quick] [--output results.json] [--save-baseline] [--startup-budget 2.0]"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.cases import (
+    bench_index, bench_matching, bench_openai_service, bench_page_reruns, bench_riasec_aggregation
+)
+from benchmarks.startup import PAGE_IMPORT_BUDGET, STARTUP_BUDGET, bench_startup
+from utils.career_index import INDEX_MIN_CATALOG_SIZE
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Slowdowns smaller than this many seconds are never flagged, whatever their ratio
+NOISE_FLOOR = 50e-6
+
+
+def compare(results, baseline, threshold, noise_floor=NOISE_FLOOR):
+    """Cases whose best time grew by more than threshold, and by more than noise_floor seconds, over the baseline
+
+    The best of the timed runs is compared because it is the least disturbed
+    by other load on the machine; the floor keeps microsecond cases from
+    being flagged for scheduler jitter.
+    """
+    regressions = []
+    for name, timing in results.items():
+        base = baseline.get('results', {}).get(name)
+        if base and base['best'] > 0:
+            ratio = timing['best'] / base['best']
+            if ratio > 1 + threshold and timing['best'] - base['best'] > noise_floor:
+                regressions.append({'case': name, 'baseline': base['best'], 'current': timing['best'], 'ratio': ratio})
+    return regressions
+
+
+def format_seconds(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help="catalog sizes")
+    parser.add_argument('--index-size', type=int, default=50000,
+                        help="catalog size for the full scan vs career index cases (0 skips them)")
+    parser.add_argument('--profiles', type=int, nargs='+', default=[1, 64, 512], help="profile counts for batch scoring")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per case")
+    parser.add_argument('--quick', action='store_true', help="small sizes and 3 runs, for a fast check")
+    parser.add_argument('--skip-pages', action='store_true', help="skip the Streamlit page rerun cases")
+    parser.add_argument('--skip-startup', action='store_true', help="skip the cold import cases")
+    parser.add_argument('--startup-budget', type=float, default=STARTUP_BUDGET,
+                        help="seconds an entry point may spend importing its modules")
+    parser.add_argument('--page-budget', type=float, default=PAGE_IMPORT_BUDGET,
+                        help="seconds a page may spend importing on top of streamlit")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25, help="slowdown flagged as a regression (0.25 = 25%%)")
+    parser.add_argument('--noise-floor', type=float, default=NOISE_FLOOR, help="seconds a case must slow down by to be flagged")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.sizes, args.profiles, args.repeat = [100, 1000], [1, 64], 3
+        args.index_size = min(args.index_size, INDEX_MIN_CATALOG_SIZE)
+
+    results = {}
+    matching, curves = bench_matching(args.sizes, args.profiles, args.repeat)
+    results.update(matching)
+    index = {}
+    if args.index_size:
+        timings, index = bench_index(args.index_size, args.repeat)
+        results.update(timings)
+    results.update(bench_riasec_aggregation(args.repeat))
+    results.update(bench_openai_service(args.repeat))
+    if not args.skip_pages:
+        results.update(bench_page_reruns(args.repeat))
+    startup, over_budget = {}, []
+    if not args.skip_startup:
+        timings, startup, over_budget = bench_startup(args.repeat, args.startup_budget, args.page_budget)
+        results.update(timings)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'results': results,
+        'curves': curves,
+        'index': index,
+        'startup': startup,
+        'over_budget': over_budget,
+        'regressions': []
+    }
+
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            report['regressions'] = compare(results, json.load(f), args.threshold, args.noise_floor)
+
+    flagged = {regression['case']: regression for regression in report['regressions']}
+    budgets = {case['case']: case for case in over_budget}
+    width = max(len(name) for name in results)
+    for name, timing in results.items():
+        note = f"  REGRESSION x{flagged[name]['ratio']:.2f}" if name in flagged else ''
+        if name in budgets:
+            note += f"  OVER BUDGET ({format_seconds(budgets[name]['budget'])})"
+        print(f"{name:<{width}}  {format_seconds(timing['median']):>10}{note}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    if index:
+        print(f"Approximate top {index['top_k']} recall on {index['catalog_size']} careers: {index['recall']:.2f}")
+    if report['regressions']:
+        print(f"{len(report['regressions'])} case(s) slower than the baseline by more than {args.threshold:.0%}")
+    if over_budget:
+        print(f"{len(over_budget)} import case(s) over their cold-start budget")
+    return 1 if report['regressions'] or over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+import itertools
+import random
+import statistics
+import time
+from contextlib import contextmanager
+
+import data.careers
+import utils.catalog_loader
+from benchmarks.synthetic import (
+    generate_catalog, generate_openai_profile, generate_profiles, generate_riasec_answers
+)
+from utils.career_index import CareerIndex, get_career_index
+from utils.career_matcher import calculate_career_matches, calculate_career_matches_batch
+from utils.career_store import CareerStore
+from utils.match_cache import fit_cache, match_cache
+from utils.page_router import PAGES as ROUTES
+from utils.scoring_engine import CompiledCatalog, get_compiled_catalog, invalidate_compiled_catalog
+
+# Each timed run repeats a call until it takes at least this long
+MIN_RUN_SECONDS = 0.02
+
+# Pages timed by rerunning them in streamlit's AppTest: step -> (module, function)
+PAGES = {step: ROUTES[step] for step in ('welcome', 'riasec', 'skills', 'values', 'results')}
+
+# AppTest polls for completion every 0.1s, so pages time themselves and report here
+_PAGE_SCRIPT = """
+import time
+from utils.session_state import init_session_state
+from benchmarks.cases import page_times, seed_session
+init_session_state()
+seed_session({step!r})
+from {module} import {function}
+start = time.perf_counter()
+{function}()
+page_times.append(time.perf_counter() - start)
+"""
+
+page_times = []
+
+
+def measure(func, repeat=5):
+    """Seconds per call of func: best and median over repeat timed runs"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_RUN_SECONDS or number >= 1 << 20:
+            break
+        number *= 2
+
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return {'best': min(times), 'median': statistics.median(times), 'repeat': repeat, 'number': number}
+
+
+@contextmanager
+def use_catalog(careers):
+    """Serve careers from get_compiled_catalog() for the duration"""
+    saved_careers, saved_catalog_path = data.careers.careers, utils.catalog_loader.catalog_path
+    data.careers.careers = careers
+    utils.catalog_loader.catalog_path = lambda: None
+    try:
+        yield get_compiled_catalog()
+    finally:
+        data.careers.careers = saved_careers
+        utils.catalog_loader.catalog_path = saved_catalog_path
+        invalidate_compiled_catalog()
+        match_cache.clear()
+
+
+def bench_matching(catalog_sizes, profile_counts, repeat=5):
+    """Matcher timings per catalog size, plus batch scaling curves (catalog size x profile count)"""
+    results, curves = {}, []
+    for size in catalog_sizes:
+        careers = generate_catalog(size, seed=size)
+        results[f'catalog_compile[{size}]'] = measure(lambda: CompiledCatalog(CareerStore.from_records(careers)), repeat)
+
+        profiles = generate_profiles(max(profile_counts + [64]), seed=size)
+        with use_catalog(careers):
+            calculate_career_matches(profiles[0])
+            rotation = itertools.count()
+
+            def match_uncached():
+                match_cache.clear()
+                calculate_career_matches(profiles[next(rotation) % len(profiles)])
+
+            results[f'match_single[{size}]'] = measure(match_uncached, repeat)
+            results[f'match_cached[{size}]'] = measure(lambda: calculate_career_matches(profiles[0]), repeat)
+
+            for count in profile_counts:
+                timing = measure(lambda: calculate_career_matches_batch(profiles[:count]), repeat)
+                results[f'match_batch[{size}x{count}]'] = timing
+                curves.append({
+                    'catalog_size': size,
+                    'profiles': count,
+                    'seconds': timing['median'],
+                    'per_profile_us': timing['median'] / count * 1e6
+                })
+    return results, curves
+
+
+def bench_index(size, repeat=5, top_k=10):
+    """Full scan vs career index (exact and approximate) on one catalog size
+
+    Returns (timings, summary); summary holds the approximate search's
+    recall@top_k against the full scan over the profiles timed.
+    """
+    careers = generate_catalog(size, seed=size)
+    profiles = generate_profiles(64, seed=size)
+    results = {}
+    with use_catalog(careers):
+        index = get_career_index()
+        results[f'index_build[{size}]'] = measure(lambda: CareerIndex(index.catalog), repeat)
+
+        for label, exact in (('scan', True), ('approx', False)):
+            rotation = itertools.count()
+
+            def match_uncached():
+                match_cache.clear()
+                fit_cache.clear()
+                calculate_career_matches(profiles[next(rotation) % len(profiles)], top_k, exact=exact)
+
+            results[f'match_{label}[{size}]'] = measure(match_uncached, repeat)
+
+        rotation = itertools.count()
+        results[f'index_exact[{size}]'] = measure(
+            lambda: index.search(profiles[next(rotation) % len(profiles)], top_k, exact=True), repeat
+        )
+
+        # The approximate search is skipped once the profile's fits are cached
+        found = []
+        for profile in profiles:
+            fit_cache.clear()
+            approx_ids = {match['id'] for match in calculate_career_matches(profile, top_k, exact=False)}
+            exact_ids = {match['id'] for match in calculate_career_matches(profile, top_k)}
+            found.append(len(exact_ids & approx_ids) / len(exact_ids))
+    return results, {'catalog_size': size, 'top_k': top_k, 'recall': statistics.fmean(found)}
+
+
+def bench_riasec_aggregation(repeat=5):
+    from utils.riasec_scoring import calculate_riasec_scores
+
+    rng = random.Random(0)
+    answers = [generate_riasec_answers(rng) for _ in range(64)]
+    rotation = itertools.count()
+    return {'riasec_aggregation': measure(lambda: calculate_riasec_scores(answers[next(rotation) % len(answers)]), repeat)}
+
+
+def bench_openai_service(repeat=5):
+    """Prompt builders and response parsers, without any API calls"""
+    from utils.openai_service import OpenAIService
+
+    # Built without __init__, which reads Streamlit session state
+    service = OpenAIService.__new__(OpenAIService)
+    profile = generate_openai_profile(random.Random(0))
+    top_types = sorted(profile['riasec_scores'].items(), key=lambda item: item[1], reverse=True)[:3]
+    frameworks = {
+        'Digital Skills': {'skills': ['Cloud', 'Security', 'Data', 'AI', 'DevOps', 'UX'], 'categories': {'Core': ['A', 'B', 'C', 'D']}}
+    }
+    career_text = service._generate_fallback_career_recommendations_text()
+    coaching_text = service._generate_fallback_coaching_questions()
+    reflection_text = service._generate_fallback_reflection_questions()
+
+    return {
+        'openai_build_career_prompt': measure(
+            lambda: service._build_career_recommendations_prompt(profile, top_types, frameworks), repeat),
+        'openai_build_coaching_prompt': measure(lambda: service._build_coaching_prompt(profile, top_types), repeat),
+        'openai_build_reflection_prompt': measure(lambda: service._build_reflection_prompt(profile, top_types), repeat),
+        'openai_parse_career_recommendations': measure(lambda: service._parse_career_recommendations(career_text), repeat),
+        'openai_parse_coaching_questions': measure(lambda: service._parse_coaching_questions(coaching_text), repeat),
+        'openai_parse_reflection_questions': measure(lambda: service._parse_reflection_questions(reflection_text), repeat)
+    }
+
+
+def seed_session(step):
+    """Session state of a user who has reached step (run inside the AppTest script)"""
+    import streamlit as st
+
+    st.session_state.authenticated = True
+    if st.session_state.get('benchmark_seeded'):
+        return
+    st.session_state.benchmark_seeded = True
+    st.session_state.current_step = step
+
+    profile = generate_profiles(1, seed=1)[0]
+    st.session_state.user_profile.update(profile)
+    if step == 'results':
+        st.session_state.recommended_careers = calculate_career_matches(profile)
+
+
+def bench_page_reruns(repeat=5):
+    """Seconds per script run of each assessment page
+
+    Every run starts a fresh AppTest session: AppTest can't rerun pages
+    with formatted radio buttons, and a rerun executes the whole page anyway.
+    The first run of each page (imports, widget registration) is not timed.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for step, (module, function) in PAGES.items():
+        script = _PAGE_SCRIPT.format(step=step, module=module, function=function)
+        page_times.clear()
+        for _ in range(repeat + 1):
+            app = AppTest.from_string(script, default_timeout=60).run()
+            if app.exception:
+                raise RuntimeError(f"{step} page failed: {app.exception[0].message}")
+        times = page_times[1:]
+        results[f'page_rerun[{step}]'] = {
+            'best': min(times), 'median': statistics.median(times), 'repeat': len(times), 'number': 1
+        }
+    return results
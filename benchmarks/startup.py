@@ -0,0 +1,115 @@
+"""Cold-start import cost of the Streamlit entry points and of each page"""
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+from utils.page_router import PAGES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ('app.py', 'app_debug.py')
+
+# Default budgets in seconds: importing everything an entry point imports,
+# and importing one page on top of streamlit (what the page router pays on first visit)
+STARTUP_BUDGET = 2.0
+PAGE_IMPORT_BUDGET = 0.05
+
+# Modules kept per target in the report, by self time
+TOP_MODULES = 15
+
+# The import statements run between two timestamps; -X importtime writes the
+# per-module breakdown to stderr, where the marker separates it from the setup
+_MARKER = 'timed imports'
+_TIMED_SCRIPT = """
+import sys
+import time
+{setup}
+sys.stderr.write({marker!r} + '\\n')
+_start = time.perf_counter()
+{imports}
+print(time.perf_counter() - _start)
+"""
+
+
+def entry_imports(path):
+    """Source of every import statement in a script, wherever it sits at module level"""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    statements = []
+
+    def collect(node):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.Import) or isinstance(child, ast.ImportFrom) and child.level == 0:
+                statements.append(ast.unparse(child))
+            elif not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                collect(child)
+
+    collect(tree)
+    return '\n'.join(statements)
+
+
+def parse_importtime(stderr):
+    """{module: (self seconds, cumulative seconds)} of the timed imports in -X importtime output"""
+    modules = {}
+    for line in stderr.partition(_MARKER)[2].splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if self_us.strip().isdigit():
+            modules[name.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return modules
+
+
+def profile_imports(imports, setup='', repeat=5):
+    """Cold import timings of imports in fresh interpreters, after setup
+
+    Returns the timing dict of the benchmark cases plus the slowest modules
+    of the median run; raises RuntimeError if the imports fail.
+    """
+    script = _TIMED_SCRIPT.format(setup=setup, marker=_MARKER, imports=imports)
+    runs = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script], cwd=ROOT, capture_output=True, text=True
+        )
+        if process.returncode:
+            raise RuntimeError(process.stderr.strip().splitlines()[-1])
+        runs.append((float(process.stdout.strip().splitlines()[-1]), process.stderr))
+
+    runs.sort(key=lambda run: run[0])
+    times = [seconds for seconds, _ in runs]
+    modules = parse_importtime(runs[len(runs) // 2][1])
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:TOP_MODULES]
+    timing = {'best': times[0], 'median': statistics.median(times), 'repeat': repeat, 'number': 1}
+    return timing, [{'module': name, 'self': own, 'cumulative': cumulative} for name, (own, cumulative) in slowest]
+
+
+def bench_startup(repeat=5, startup_budget=STARTUP_BUDGET, page_budget=PAGE_IMPORT_BUDGET):
+    """Cold import timings of the entry points and pages
+
+    Returns (results, profiles, over_budget): timing dicts keyed like the
+    other cases, the slowest modules per target, and the targets whose
+    median import time exceeds their budget.
+    """
+    targets = [
+        (f'startup[{entry}]', '', entry_imports(os.path.join(ROOT, entry)), startup_budget) for entry in ENTRY_POINTS
+    ] + [
+        (f'page_import[{step}]', 'import streamlit', f'import {module}', page_budget) for step, (module, _) in PAGES.items()
+    ]
+
+    results, profiles, over_budget = {}, {}, []
+    for name, setup, imports, budget in targets:
+        try:
+            timing, modules = profile_imports(imports, setup, repeat)
+        except RuntimeError as e:
+            # e.g. an optional dependency of app_debug.py that is not installed
+            profiles[name] = {'error': str(e)}
+            print(f"{name} skipped: {e}")
+            continue
+        results[name] = timing
+        profiles[name] = {'budget': budget, 'modules': modules}
+        if timing['median'] > budget:
+            over_budget.append({'case': name, 'budget': budget, 'current': timing['median']})
+    return results, profiles, over_budget
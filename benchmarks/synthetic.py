@@ -0,0 +1,68 @@
+import random
+
+from data.riasec_questions import riasec_questions
+from data.skills_list import skills_categories
+from data.work_values import work_values
+from utils.scoring_engine import RIASEC_TYPES, VALUE_KEYWORDS
+
+ASSESSED_SKILLS = [skill for category in skills_categories for skill in category['skills']]
+
+# Catalog-only skills, so catalogs also carry skills nobody is assessed on
+EXTRA_SKILLS = [f'Specialist Skill {i}' for i in range(40)]
+
+# Work environments mixing value keywords with neutral settings
+ENVIRONMENTS = [keywords[0].capitalize() for keywords in VALUE_KEYWORDS.values()] + [
+    'Office', 'Remote', 'Hospitals', 'Outdoors', 'Shift work', 'Laboratories', 'Retail floor', 'Field work'
+]
+
+
+def generate_career(rng, i):
+    return {
+        'id': f'career-{i}',
+        'title': f'Synthetic Career {i}',
+        'description': 'Generated for benchmarking',
+        'primary_type': rng.choice(RIASEC_TYPES),
+        'secondary_type': rng.choice(RIASEC_TYPES),
+        'required_skills': rng.sample(ASSESSED_SKILLS + EXTRA_SKILLS, rng.randint(3, 7)),
+        'work_environment': rng.sample(ENVIRONMENTS, rng.randint(2, 5)),
+        'salary_range': f'${rng.randint(30, 90)},000 - ${rng.randint(91, 200)},000',
+        'growth_outlook': f'Good - {rng.randint(1, 30)}% growth expected',
+        'education': "Bachelor's degree"
+    }
+
+
+def generate_catalog(size, seed=0):
+    """size career dicts in the data.careers format"""
+    rng = random.Random(seed)
+    return [generate_career(rng, i) for i in range(size)]
+
+
+def generate_profile(rng):
+    """User profile as built by the assessment pages"""
+    return {
+        'name': 'Benchmark User',
+        'riasecScores': {type_name: rng.randint(4, 20) / 4 for type_name in RIASEC_TYPES},
+        'skillsConfidence': {skill: rng.randint(1, 5) for skill in ASSESSED_SKILLS},
+        'workValues': rng.sample([value['name'] for value in work_values], 5),
+        'completedAssessments': ['riasec', 'skills', 'values']
+    }
+
+
+def generate_profiles(count, seed=0):
+    rng = random.Random(seed)
+    return [generate_profile(rng) for _ in range(count)]
+
+
+def generate_riasec_answers(rng, questions=riasec_questions):
+    """question id -> rating, leaving some questions unanswered"""
+    return {question['id']: rng.randint(1, 5) for question in questions if rng.random() > 0.1}
+
+
+def generate_openai_profile(rng):
+    """Profile in the snake_case shape the OpenAI prompt builders read"""
+    profile = generate_profile(rng)
+    return {
+        'riasec_scores': profile['riasecScores'],
+        'skills_confidence': {skill: level * 20 for skill, level in profile['skillsConfidence'].items()},
+        'work_values': profile['workValues']
+    }
@@ -0,0 +1,37 @@
+# Career skills that are not assessed directly, mapped to the assessed skills
+# (data/skills_list.py) they draw on. Weights are the share of the career skill
+# each assessed skill stands in for, adding up to at most 1. Keys are matched
+# case- and punctuation-insensitively; an empty mapping marks a skill with no
+# assessed counterpart.
+skill_synonyms = {
+    'Statistics': {'Mathematics': 0.5, 'Data Analysis': 0.5},
+    'Machine Learning': {'Programming': 0.5, 'Data Analysis': 0.5},
+    'Data Science': {'Data Analysis': 0.5, 'Programming': 0.3, 'Mathematics': 0.2},
+    'Data Visualization': {'Visualization': 0.6, 'Data Analysis': 0.4},
+    'Analytical Thinking': {'Analytics': 0.5, 'Problem Solving': 0.5},
+    'Critical Thinking': {'Problem Solving': 0.6, 'Analytics': 0.4},
+    'Research': {'Scientific Research': 1.0},
+    'Psychology': {'Empathy': 0.5, 'Scientific Research': 0.5},
+    'Patient Care': {'Empathy': 0.6, 'Customer Service': 0.4},
+    'Patience': {'Empathy': 0.6, 'Teaching': 0.4},
+    'Ethics': {'Empathy': 0.5, 'Attention to Detail': 0.5},
+    'Counseling': {'Empathy': 0.5, 'Communication': 0.5},
+    'Public Speaking': {'Communication': 1.0},
+    'Presentation': {'Communication': 1.0},
+    'Collaboration': {'Teamwork': 1.0},
+    'People Management': {'Leadership': 0.6, 'Conflict Resolution': 0.4},
+    'Mentoring': {'Teaching': 0.6, 'Leadership': 0.4},
+    'Software Development': {'Programming': 1.0},
+    'Coding': {'Programming': 1.0},
+    'Web Development': {'Programming': 0.7, 'Design Software': 0.3},
+    'AutoCAD': {'CAD Software': 1.0},
+    'Microsoft Office': {'Computer Skills': 1.0},
+    'Budgeting': {'Financial Management': 0.7, 'Planning': 0.3},
+    'Accounting': {'Financial Management': 0.7, 'Attention to Detail': 0.3},
+    'Scheduling': {'Time Management': 0.5, 'Planning': 0.5},
+    'Record Keeping': {'Documentation': 0.7, 'Organization': 0.3},
+    'Copywriting': {'Writing': 0.7, 'Marketing': 0.3},
+    'Product Design': {'Design Thinking': 0.6, 'Creativity': 0.4},
+    'Physical Stamina': {},
+    'Manual Dexterity': {},
+}
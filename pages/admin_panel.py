@@ -1,5 +1,8 @@
 import streamlit as st
 import json
+import os
+import re
+import time
 
 def show_admin_panel():
     st.markdown("""
@@ -16,19 +19,12 @@ def show_admin_panel():
         st.markdown("### Assessment Analytics")
         
         # Check if we have assessment data
-        if st.session_state.assessment_history:
+        history = st.session_state.assessment_history
+        if history:
             # Get latest assessment data
-            latest_riasec = None
-            latest_skills = None
-            latest_values = None
-            
-            for assessment in st.session_state.assessment_history:
-                if assessment['type'] == 'riasec':
-                    latest_riasec = assessment['data']
-                elif assessment['type'] == 'skills':
-                    latest_skills = assessment['data']
-                elif assessment['type'] == 'values':
-                    latest_values = assessment['data']
+            latest_riasec = history.latest('riasec')
+            latest_skills = history.latest('skills')
+            latest_values = history.latest('values')
             
             # Display user info
             st.markdown("#### Current User Profile")
@@ -65,37 +61,238 @@ def show_admin_panel():
                 st.info("No values assessment data available yet")
         else:
             st.info("No assessment data available. Complete an assessment to see analytics.")
-    
+
+        # Assessments of all sessions, from the assessment store
+        from utils.assessment_store import get_assessment_store
+        store = get_assessment_store()
+        st.markdown("#### All Assessments")
+        orgs = store.orgs()
+        org = st.selectbox("Organization:", ["All organizations"] + orgs, key="analytics_org")
+        org = None if org == "All organizations" else org
+        # Running aggregates, so this costs the same however many assessments are stored
+        population = store.population(org=org)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Assessments", population['assessments'])
+        with col2:
+            st.metric("Users", population['users'])
+        with col3:
+            st.metric("Pending Writes", store.pending())
+        if store.last_error:
+            st.warning(f"{store.failed} assessment(s) could not be saved: {store.last_error}")
+        
+        if population['assessments']:
+            st.markdown("**Average RIASEC profile**")
+            for type_name, stats in population['riasec'].items():
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.progress(min(stats.mean / 5, 1.0))
+                with col2:
+                    st.markdown(f"**{type_name.capitalize()}:** {stats.mean:.1f}/5 (±{stats.std:.1f})")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Most chosen work values**")
+                for value, count in population['values']:
+                    st.markdown(f"- {value}: {count}")
+            with col2:
+                st.markdown("**Most frequent top match**")
+                for title, count, average in population['top_matches']:
+                    st.markdown(f"- {title}: {count} ({average:.0f}% avg)")
+            
+            if population['skills']:
+                st.markdown("**Skill confidence distribution**")
+                st.dataframe([
+                    {
+                        'Skill': skill,
+                        'Ratings': sum(levels.values()),
+                        'Average': sum(level * count for level, count in levels.items()) / sum(levels.values()),
+                        **{str(level): levels.get(level, 0) for level in range(1, 6)}
+                    }
+                    for skill, levels in population['skills'].items()
+                ], use_container_width=True, hide_index=True)
+            
+            st.markdown("**Recent assessments**")
+            st.dataframe([
+                {
+                    'User': row['user_name'] or '—',
+                    'Organization': row['org'],
+                    'Persona': row['persona'],
+                    'Completed': time.strftime('%Y-%m-%d %H:%M', time.localtime(row['created_at']))
+                }
+                for row in store.recent(org=org)
+            ], use_container_width=True, hide_index=True)
+        
+        # Process-wide career match cache
+        from utils.match_cache import match_cache
+        st.markdown("#### Career Match Cache")
+        cache_stats = match_cache.stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Hit Rate", f"{cache_stats['hit_rate']:.0%}")
+        with col2:
+            st.metric("Hits / Misses", f"{cache_stats['hits']} / {cache_stats['misses']}")
+        with col3:
+            st.metric("Entries", f"{cache_stats['size']} / {cache_stats['max_size']}")
+        with col4:
+            st.metric("Evictions", cache_stats['evictions'])
+
+        if st.button("Clear Match Cache"):
+            match_cache.clear()
+            st.rerun()
+
     with tab2:
         st.markdown("### Content Management")
         
         content_type = st.selectbox(
             "Select content to manage:",
-            ["RIASEC Questions", "Skills Categories", "Work Values", "Career Database", "Coaching Questions"]
+            ["RIASEC Questions", "Skills Categories", "Work Values", "Career Database", "Scoring Weights", "Coaching Questions"]
         )
         
         if content_type == "RIASEC Questions":
             st.markdown("#### RIASEC Questions Configuration")
             st.info("Upload a JSON file with RIASEC questions or edit existing ones")
             
-            uploaded_file = st.file_uploader("Upload RIASEC questions (JSON)", type="json")
+            from utils.question_store import get_questions, questions_path, reset_questions, save_questions
+            
+            st.write(f"The assessment uses {len(get_questions())} questions.")
+            if os.path.exists(questions_path()) and st.button("Restore Default Questions"):
+                reset_questions()
+                st.rerun()
+            
+            uploaded_file = st.file_uploader("Upload RIASEC questions (JSON)", type=["json", "jsonl"])
             if uploaded_file:
-                questions = json.load(uploaded_file)
-                st.success(f"Loaded {len(questions)} questions")
-                st.json(questions[:2])  # Show preview
+                from utils.catalog_ingest import iter_uploaded_records, new_report, normalize_question, validated
+
+                report = new_report()
+                try:
+                    questions = list(validated(iter_uploaded_records(uploaded_file), normalize_question, report))
+                except ValueError as e:
+                    st.error(f"Could not read {uploaded_file.name}: {e}")
+                else:
+                    st.success(f"Loaded {report['accepted']} questions")
+                    show_rejected(report)
+                    st.json(questions[:2])  # Show preview
+                    if questions and st.button("Replace Questions"):
+                        try:
+                            save_questions(questions)
+                        except ValueError as e:
+                            st.error(f"Questions not saved: {e}")
+                        else:
+                            st.success(f"The assessment now uses these {len(questions)} questions")
         
         elif content_type == "Career Database":
             st.markdown("#### Career Database Management")
             st.info("Add or modify career paths in the database")
             
+            from utils.catalog_ingest import add_career, import_careers, iter_uploaded_records, writable_catalog_path
+            from utils.catalog_loader import normalize_career
+
+            uploaded_file = st.file_uploader("Upload careers (CSV, JSON or JSON Lines)", type=["csv", "json", "jsonl"])
+            if uploaded_file and st.button("Import Careers"):
+                progress_bar = st.progress(0.0, text="Importing careers...")
+
+                def show_progress(report):
+                    done = min(uploaded_file.tell() / max(uploaded_file.size, 1), 1.0)
+                    progress_bar.progress(done, text=f"Imported {report['accepted']} careers...")
+
+                try:
+                    report = import_careers(iter_uploaded_records(uploaded_file), writable_catalog_path(), show_progress)
+                except ValueError as e:
+                    st.error(f"Import failed: {e}")
+                else:
+                    progress_bar.progress(1.0, text="Import complete")
+                    st.success(f"Imported {report['accepted']} careers")
+                    show_rejected(report)
+
             with st.expander("Add New Career"):
                 career_title = st.text_input("Career Title")
                 career_desc = st.text_area("Description")
                 primary_type = st.selectbox("Primary RIASEC Type", 
                     ["realistic", "investigative", "artistic", "social", "enterprising", "conventional"])
+                secondary_type = st.selectbox("Secondary RIASEC Type",
+                    ["(none)", "realistic", "investigative", "artistic", "social", "enterprising", "conventional"])
+                required_skills = st.text_input("Required Skills (comma-separated)")
+                work_environment = st.text_input("Work Environment (comma-separated)")
+                salary_range = st.text_input("Salary Range")
+                growth_outlook = st.text_input("Growth Outlook")
+                education = st.text_input("Education")
                 
                 if st.button("Add Career"):
-                    st.success(f"Career '{career_title}' added successfully!")
+                    career = {
+                        'id': re.sub(r'[^a-z0-9]+', '-', career_title.lower()).strip('-'),
+                        'title': career_title,
+                        'description': career_desc,
+                        'primary_type': primary_type,
+                        'required_skills': required_skills.split(','),
+                        'work_environment': work_environment.split(','),
+                        'salary_range': salary_range,
+                        'growth_outlook': growth_outlook,
+                        'education': education
+                    }
+                    if secondary_type != "(none)":
+                        career['secondary_type'] = secondary_type
+                    try:
+                        add_career(normalize_career(career), writable_catalog_path())
+                    except ValueError as e:
+                        st.error(f"Career not added: {e}")
+                    else:
+                        st.success(f"Career '{career_title}' added successfully!")
+        
+        elif content_type == "Scoring Weights":
+            st.markdown("#### Scoring Weights")
+            st.info("Points each component contributes to a match score, per tenant")
+            
+            from utils.scoring_weights import (
+                DEFAULT_TENANT, get_weights, list_tenants, reset_weights, set_weights, validate_weights
+            )
+            
+            tenants = sorted(set(list_tenants()) | {DEFAULT_TENANT, st.session_state.tenant})
+            tenant = st.selectbox("Tenant", tenants + ["(new tenant)"], index=tenants.index(st.session_state.tenant))
+            if tenant == "(new tenant)":
+                tenant = st.text_input("Tenant name").strip()
+            current = get_weights(tenant)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                riasec_weight = st.number_input("Interests (RIASEC)", 0.0, 100.0, float(current.riasec), step=5.0)
+            with col2:
+                skills_weight = st.number_input("Skills", 0.0, 100.0, float(current.skills), step=5.0)
+            with col3:
+                values_weight = st.number_input("Work Values", 0.0, 100.0, float(current.values), step=5.0)
+            primary_share = st.slider(
+                "Share of interest points from the primary type", 0.0, 1.0, float(current.primary_share), step=0.05
+            )
+            weights = [riasec_weight, skills_weight, values_weight, primary_share, round(1 - primary_share, 2)]
+            
+            try:
+                weights = validate_weights(weights)
+            except ValueError as e:
+                st.error(str(e))
+                weights = None
+            
+            profile = st.session_state.user_profile
+            if weights and profile['workValues']:
+                from utils.career_matcher import calculate_career_matches
+                
+                # Re-ranks the cached component fits of the current profile
+                start = time.perf_counter()
+                preview = calculate_career_matches(profile, 5, weights=weights)
+                elapsed = time.perf_counter() - start
+                st.markdown("**Preview with the current profile:**")
+                for i, career in enumerate(preview):
+                    st.markdown(f"{i+1}. {career['title']} - {career['matchScore']}% Match")
+                st.caption(f"Re-ranked in {elapsed * 1000:.2f} ms")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("Save Weights", disabled=not (weights and tenant)):
+                    set_weights(tenant, weights)
+                    st.success(f"Weights saved for {tenant}")
+            with col2:
+                if st.button("Reset to Default", disabled=not tenant):
+                    reset_weights(tenant)
+                    st.rerun()
     
     with tab3:
         st.markdown("### API Configuration")
@@ -124,12 +321,12 @@ def show_admin_panel():
             if export_format == "JSON":
                 data = {
                     "user_profile": st.session_state.user_profile,
-                    "assessment_history": st.session_state.assessment_history,
+                    "assessment_history": st.session_state.assessment_history.entries(),
                     "recommended_careers": st.session_state.recommended_careers
                 }
                 st.download_button(
                     label="Download JSON",
-                    data=json.dumps(data, indent=2),
+                    data=json.dumps(data, indent=2, default=dict),
                     file_name="assessment_data.json",
                     mime="application/json"
                 )
@@ -150,3 +347,11 @@ def show_admin_panel():
             from utils.simple_auth import logout
             logout()
             st.rerun()
+
+
+def show_rejected(report):
+    """List the records an upload rejected"""
+    if report['rejected']:
+        st.warning(f"Skipped {report['rejected']} invalid records")
+        for error in report['errors']:
+            st.markdown(f"- {error}")
@@ -1,5 +1,6 @@
 import streamlit as st
 from data.coaching_questions import coaching_questions
+from pages.score_breakdown import show_score_breakdown
 
 def show_coaching_dashboard():
     st.markdown("""
@@ -39,6 +40,13 @@ def show_coaching_dashboard():
                     placeholder="Reflect on this question..."
                 )
     
+    # Why the top careers were recommended
+    if st.session_state.recommended_careers:
+        st.markdown("### Your Top Career Matches")
+        for career in st.session_state.recommended_careers[:3]:
+            with st.expander(f"{career['title']} - {career['matchScore']}% Match"):
+                show_score_breakdown(career)
+    
     st.markdown("---")
     
     # Career exploration tools
@@ -76,7 +84,7 @@ def show_coaching_dashboard():
         if st.button("🔄 Start New Assessment", use_container_width=True):
             # Reset session state
             for key in ['user_profile', 'riasec_answers', 'skills_answers', 
-                       'selected_values', 'recommended_careers', 'game_progress']:
+                       'selected_values', 'recommended_careers', 'game_progress', 'what_if_scorer']:
                 if key in st.session_state:
                     del st.session_state[key]
             st.session_state.current_step = 'persona'
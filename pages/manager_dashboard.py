@@ -1,4 +1,5 @@
 import streamlit as st
+from pages.score_breakdown import show_score_breakdown
 
 def show_manager_dashboard():
     st.markdown("""
@@ -34,6 +35,13 @@ def show_manager_dashboard():
     for skill, confidence in top_skills:
         st.markdown(f"- {skill}: {confidence}/5")
     
+    # Career matches and what drives them
+    if st.session_state.recommended_careers:
+        st.markdown("**Top Career Matches:**")
+        for career in st.session_state.recommended_careers[:3]:
+            with st.expander(f"{career['title']} - {career['matchScore']}% Match"):
+                show_score_breakdown(career)
+    
     st.markdown("---")
     
     # Development recommendations
@@ -99,7 +107,7 @@ def show_manager_dashboard():
     if st.button("🔄 Start New Assessment", use_container_width=True):
         # Reset session state
         for key in ['user_profile', 'riasec_answers', 'skills_answers', 
-                   'selected_values', 'recommended_careers', 'game_progress']:
+                   'selected_values', 'recommended_careers', 'game_progress', 'what_if_scorer']:
             if key in st.session_state:
                 del st.session_state[key]
         st.session_state.current_step = 'persona'
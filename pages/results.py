@@ -1,5 +1,9 @@
+import time
+
 import streamlit as st
-import plotly.graph_objects as go
+
+from pages.score_breakdown import show_score_breakdown
+from utils.riasec_chart import radar_figure
 
 def show_results():
     st.markdown(f"""
@@ -12,29 +16,8 @@ def show_results():
     # RIASEC Profile
     st.markdown("## Your RIASEC Profile")
     
-    # Create radar chart
-    categories = list(st.session_state.user_profile['riasecScores'].keys())
-    values = list(st.session_state.user_profile['riasecScores'].values())
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=[cat.capitalize() for cat in categories],
-        fill='toself',
-        name='Your Profile'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 5]
-            )),
-        showlegend=False,
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    # Radar chart, cached per RIASEC score vector
+    st.plotly_chart(radar_figure(st.session_state.user_profile['riasecScores']), use_container_width=True)
     
     # Top types
     sorted_types = sorted(
@@ -57,9 +40,14 @@ def show_results():
             st.markdown(f"**Description:** {career['description']}")
             st.markdown(f"**Primary Type:** {career['primary_type'].capitalize()}")
             st.markdown(f"**Required Skills:** {', '.join(career['required_skills'])}")
-            st.markdown(f"**Salary Range:** {career['salary_range']}")
-            st.markdown(f"**Growth Outlook:** {career['growth_outlook']}")
-            st.markdown(f"**Education:** {career['education']}")
+            # Catalogs may leave these out (only id, title and primary_type are required)
+            st.markdown(f"**Salary Range:** {career.get('salary_range', 'Not specified')}")
+            st.markdown(f"**Growth Outlook:** {career.get('growth_outlook', 'Not specified')}")
+            st.markdown(f"**Education:** {career.get('education', 'Not specified')}")
+            show_score_breakdown(career)
+    
+    show_career_browser()
+    show_what_if()
     
     st.markdown("---")
     
@@ -78,8 +66,151 @@ def show_results():
         if st.button("🔄 Start Over", use_container_width=True):
             # Reset session state
             for key in ['user_profile', 'riasec_answers', 'skills_answers', 
-                       'selected_values', 'recommended_careers', 'game_progress']:
+                       'selected_values', 'recommended_careers', 'game_progress', 'what_if_scorer']:
                 if key in st.session_state:
                     del st.session_state[key]
             st.session_state.current_step = 'persona'
             st.rerun()
+
+
+def show_career_browser():
+    """Best matches among careers passing salary, growth and education filters"""
+    from utils.career_facets import EDUCATION_LEVELS
+    from utils.career_matcher import calculate_career_matches
+    from utils.scoring_engine import get_compiled_catalog
+    from utils.scoring_weights import get_weights
+    
+    facets = get_compiled_catalog().facets
+    salary_limits = facets.limits('salary_min')
+    growth_limits = facets.limits('growth')
+    
+    with st.expander("🔎 Browse Careers"):
+        st.caption("Filter the whole career catalog and see your best matches among the careers left")
+        
+        col1, col2, col3 = st.columns(3)
+        # A slider needs a non-empty range, so a facet with a single value gets none
+        with col1:
+            min_salary = None
+            if salary_limits and int(salary_limits[1]) > 0:
+                min_salary = st.slider(
+                    "Starting salary at least ($)",
+                    min_value=0,
+                    max_value=int(salary_limits[1]),
+                    value=0,
+                    step=5000,
+                    key="browse_min_salary"
+                ) or None
+        with col2:
+            min_growth = None
+            if growth_limits and int(growth_limits[1]) > int(min(growth_limits[0], 0)):
+                min_growth = st.slider(
+                    "Growth at least (%)",
+                    min_value=int(min(growth_limits[0], 0)),
+                    max_value=int(growth_limits[1]),
+                    value=int(min(growth_limits[0], 0)),
+                    key="browse_min_growth"
+                )
+                if min_growth <= growth_limits[0]:
+                    min_growth = None
+        with col3:
+            education = st.selectbox(
+                "Education up to",
+                ["Any"] + list(EDUCATION_LEVELS),
+                key="browse_max_education"
+            )
+            max_education = None if education == "Any" else EDUCATION_LEVELS.index(education)
+        
+        start = time.perf_counter()
+        filtered_matches = calculate_career_matches(
+            st.session_state.user_profile,
+            5,
+            weights=get_weights(st.session_state.get('tenant')),
+            filters={'min_salary': min_salary, 'min_growth': min_growth, 'max_education': max_education}
+        )
+        elapsed = time.perf_counter() - start
+        
+        if not filtered_matches:
+            st.info("No careers pass these filters")
+        for i, career in enumerate(filtered_matches):
+            st.markdown(
+                f"**{i+1}. {career['title']}** - {career['matchScore']}% Match · "
+                f"{career.get('salary_range', 'Salary not specified')} · {career.get('growth_outlook', 'Growth not specified')}"
+            )
+        st.caption(f"Filtered and ranked in {elapsed * 1000:.2f} ms")
+
+
+def show_what_if():
+    """Re-rank careers as the user tweaks one skill or swaps one work value"""
+    from data.work_values import work_values
+    from utils.career_matcher import create_what_if_scorer, rank_what_if
+    from utils.scoring_engine import get_compiled_catalog
+    from utils.scoring_weights import get_weights
+    
+    profile = st.session_state.user_profile
+    weights = get_weights(st.session_state.get('tenant'))
+    
+    # Scorer keeps per-career score components between reruns
+    scorer = st.session_state.get('what_if_scorer')
+    if scorer is None or scorer.catalog is not get_compiled_catalog():
+        scorer = create_what_if_scorer(profile, weights)
+        st.session_state.what_if_scorer = scorer
+    elif scorer.weights != weights:
+        # New weights only change how the kept fits are combined
+        scorer.weights = weights
+    
+    with st.expander("🔧 What-if Explorer"):
+        st.caption("Change one skill or swap one work value to see how your matches move")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if profile['skillsConfidence']:
+                skill = st.selectbox("Skill", list(profile['skillsConfidence']), key="what_if_skill")
+                confidence = st.slider(
+                    f"Confidence in {skill}",
+                    min_value=1,
+                    max_value=5,
+                    value=scorer.skills_confidence[skill],
+                    key=f"what_if_skill_{skill.replace(' ', '_')}"
+                )
+        
+        with col2:
+            if profile['workValues']:
+                swap_out = st.selectbox("Swap out", profile['workValues'], key="what_if_swap_out")
+                swap_in = st.selectbox(
+                    "Swap in",
+                    ["(keep)"] + [v['name'] for v in work_values if v['name'] not in profile['workValues']],
+                    key="what_if_swap_in"
+                )
+        
+        # Apply only what changed since the last rerun
+        start = time.perf_counter()
+        if profile['skillsConfidence']:
+            scorer.set_skill(skill, confidence)
+        if profile['workValues']:
+            scorer.set_work_values([
+                swap_in if value == swap_out and swap_in != "(keep)" else value
+                for value in profile['workValues']
+            ])
+        what_if_matches = rank_what_if(scorer, 5)
+        elapsed = time.perf_counter() - start
+        
+        current_ranks = {career['id']: i for i, career in enumerate(st.session_state.recommended_careers)}
+        for i, career in enumerate(what_if_matches):
+            previous = current_ranks.get(career['id'])
+            if previous is None:
+                movement = "new"
+            elif previous > i:
+                movement = f"▲ {previous - i}"
+            elif previous < i:
+                movement = f"▼ {i - previous}"
+            else:
+                movement = "–"
+            st.markdown(f"**{i+1}. {career['title']}** - {career['matchScore']}% Match ({movement})")
+        
+        st.caption(f"Re-ranked in {elapsed * 1000:.2f} ms")
+        
+        if st.button("↺ Reset What-if", key="what_if_reset"):
+            for key in list(st.session_state.keys()):
+                if key.startswith('what_if_'):
+                    del st.session_state[key]
+            st.rerun()
@@ -0,0 +1,18 @@
+import streamlit as st
+
+from utils.scoring_engine import RIASEC_WEIGHT, SKILLS_WEIGHT, VALUES_WEIGHT
+
+
+def show_score_breakdown(career):
+    """Points from each scoring component and what matched, for one recommended career"""
+    breakdown = career.get('scoreBreakdown')
+    if not breakdown:
+        return
+    weights = breakdown.get('weights', {'riasec': RIASEC_WEIGHT, 'skills': SKILLS_WEIGHT, 'values': VALUES_WEIGHT})
+    st.markdown(
+        f"**Score Breakdown:** Interests {breakdown['riasec']:.1f}/{weights['riasec']:g} · "
+        f"Skills {breakdown['skills']:.1f}/{weights['skills']:g} · "
+        f"Values {breakdown['values']:.1f}/{weights['values']:g}"
+    )
+    st.markdown(f"**Matched Skills:** {', '.join(breakdown['matchedSkills']) or 'None'}")
+    st.markdown(f"**Matched Values:** {', '.join(breakdown['matchedValues']) or 'None'}")
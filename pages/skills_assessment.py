@@ -1,5 +1,6 @@
 import streamlit as st
 from data.skills_list import skills_categories
+from utils.interning import SkillLevels
 
 def show_skills_assessment():
     st.markdown("""
@@ -14,51 +15,56 @@ def show_skills_assessment():
     
     st.markdown("---")
     
-    # Skills by category
-    for category in skills_categories:
-        st.markdown(f"### {category['name']}")
+    # Sliders stay in the browser until the form is submitted, so moving
+    # one doesn't rerun the app
+    with st.form("skills_form"):
+        confidences = {}
         
-        cols = st.columns(2)
-        for i, skill in enumerate(category['skills']):
-            with cols[i % 2]:
-                # Create unique key
-                key = f"skill_{skill.replace(' ', '_')}"
-                
-                # Slider for confidence
-                confidence = st.slider(
-                    skill,
-                    min_value=1,
-                    max_value=5,
-                    value=st.session_state.skills_answers.get(skill, 3),
-                    key=key,
-                    format="%d"
-                )
-                
-                st.session_state.skills_answers[skill] = confidence
+        # Skills by category
+        for category in skills_categories:
+            st.markdown(f"### {category['name']}")
+            
+            cols = st.columns(2)
+            for i, skill in enumerate(category['skills']):
+                with cols[i % 2]:
+                    # Create unique key
+                    key = f"skill_{skill.replace(' ', '_')}"
+                    
+                    # Slider for confidence
+                    confidences[skill] = st.slider(
+                        skill,
+                        min_value=1,
+                        max_value=5,
+                        value=st.session_state.skills_answers.get(skill, 3),
+                        key=key,
+                        format="%d"
+                    )
+            
+            st.markdown("---")
         
-        st.markdown("---")
+        # Navigation (both buttons keep the ratings given so far)
+        col1, col2 = st.columns(2)
+        with col1:
+            back = st.form_submit_button("← Back", use_container_width=True)
+        with col2:
+            submitted = st.form_submit_button("Continue →", use_container_width=True)
     
-    # Navigation
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("← Back", use_container_width=True):
-            st.session_state.current_step = 'riasec'
-            st.rerun()
+    if back or submitted:
+        st.session_state.skills_answers.update(confidences)
     
-    with col2:
-        if st.button("Continue →", use_container_width=True):
-            # Update profile
-            st.session_state.user_profile['skillsConfidence'] = st.session_state.skills_answers.copy()
-            st.session_state.user_profile['completedAssessments'].append('skills')
-            
-            # Store in assessment history
-            st.session_state.assessment_history.append({
-                'type': 'skills',
-                'data': st.session_state.skills_answers.copy(),
-                'timestamp': 'current'
-            })
-            
-            # Navigate
-            st.session_state.current_step = 'values'
-            st.session_state.game_progress = 60
-            st.rerun()
+    if back:
+        st.session_state.current_step = 'riasec'
+        st.rerun()
+    
+    if submitted:
+        # Update profile (stored compactly as skill IDs and levels)
+        st.session_state.user_profile['skillsConfidence'] = SkillLevels.from_dict(st.session_state.skills_answers)
+        st.session_state.user_profile['completedAssessments'].append('skills')
+        
+        # Store in assessment history
+        st.session_state.assessment_history.record('skills', st.session_state.skills_answers)
+        
+        # Navigate
+        st.session_state.current_step = 'values'
+        st.session_state.game_progress = 60
+        st.rerun()
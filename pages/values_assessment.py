@@ -14,70 +14,89 @@ def show_values_assessment():
     
     st.markdown("---")
     
-    # Display selected count
+    # Display selected count (as of the last submit; ticking boxes doesn't rerun the app)
     selected_count = len(st.session_state.selected_values)
-    if selected_count < 5:
-        st.info(f"Selected: {selected_count}/5 values")
-    else:
+    if selected_count == 5:
         st.success(f"✓ Selected: {selected_count}/5 values")
+    else:
+        st.info("Select exactly 5 values, then complete the assessment")
+    
+    with st.form("values_form"):
+        # Values grid
+        checked = {}
+        cols = st.columns(2)
+        for i, value in enumerate(work_values):
+            with cols[i % 2]:
+                # Checkbox for each value
+                checked[value['name']] = st.checkbox(
+                    value['name'],
+                    value=value['name'] in st.session_state.selected_values,
+                    key=f"value_{value['name']}"
+                )
+                
+                st.caption(value['description'])
+                st.markdown("---")
+        
+        # Navigation (both buttons keep the selection made so far)
+        col1, col2 = st.columns(2)
+        with col1:
+            back = st.form_submit_button("← Back", use_container_width=True)
+        with col2:
+            submitted = st.form_submit_button("Complete Assessment →", use_container_width=True)
     
-    # Values grid
-    cols = st.columns(2)
-    for i, value in enumerate(work_values):
-        with cols[i % 2]:
-            # Checkbox for each value
-            selected = st.checkbox(
-                value['name'],
-                value=value['name'] in st.session_state.selected_values,
-                key=f"value_{value['name']}",
-                disabled=len(st.session_state.selected_values) >= 5 and value['name'] not in st.session_state.selected_values
-            )
-            
-            st.caption(value['description'])
-            
-            # Update selection
-            if selected and value['name'] not in st.session_state.selected_values:
-                st.session_state.selected_values.append(value['name'])
-            elif not selected and value['name'] in st.session_state.selected_values:
-                st.session_state.selected_values.remove(value['name'])
-            
-            st.markdown("---")
+    if back or submitted:
+        # Keep earlier picks in their order, then add new ones
+        st.session_state.selected_values = [
+            name for name in st.session_state.selected_values if checked.get(name)
+        ] + [
+            name for name, is_checked in checked.items() if is_checked and name not in st.session_state.selected_values
+        ]
     
-    # Navigation
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("← Back", use_container_width=True):
-            st.session_state.current_step = 'skills'
-            st.rerun()
+    if back:
+        st.session_state.current_step = 'skills'
+        st.rerun()
     
-    with col2:
-        if st.button(
-            "Complete Assessment →", 
-            use_container_width=True,
-            disabled=len(st.session_state.selected_values) != 5
-        ):
-            # Update profile
-            st.session_state.user_profile['workValues'] = st.session_state.selected_values.copy()
-            st.session_state.user_profile['completedAssessments'].append('values')
-            
-            # Store in assessment history
-            st.session_state.assessment_history.append({
-                'type': 'values',
-                'data': st.session_state.selected_values.copy(),
-                'timestamp': 'current'
-            })
-            
-            # Calculate career matches
-            from utils.career_matcher import calculate_career_matches
-            st.session_state.recommended_careers = calculate_career_matches(st.session_state.user_profile)
-            
-            # Navigate based on persona
-            if st.session_state.selected_persona == 'individual':
-                st.session_state.current_step = 'results'
-            elif st.session_state.selected_persona == 'coach':
-                st.session_state.current_step = 'coaching'
-            else:
-                st.session_state.current_step = 'manager'
-            
-            st.session_state.game_progress = 100
-            st.rerun()
+    if submitted and len(st.session_state.selected_values) != 5:
+        st.error(f"Please select exactly 5 values (you selected {len(st.session_state.selected_values)})")
+    elif submitted:
+        # Update profile
+        st.session_state.user_profile['workValues'] = st.session_state.selected_values.copy()
+        st.session_state.user_profile['completedAssessments'].append('values')
+        
+        # Store in assessment history
+        st.session_state.assessment_history.record('values', st.session_state.selected_values)
+        
+        # Calculate career matches
+        from utils.career_matcher import calculate_career_matches
+        from utils.scoring_weights import get_weights
+        st.session_state.recommended_careers = calculate_career_matches(
+            st.session_state.user_profile,
+            weights=get_weights(st.session_state.get('tenant'))
+        )
+
+        # Drop the what-if scorer and controls left from an earlier profile
+        for key in list(st.session_state.keys()):
+            if key.startswith('what_if_'):
+                del st.session_state[key]
+
+        # Persist the completed assessment (written in the background)
+        from utils.assessment_store import get_assessment_store
+        get_assessment_store().save(
+            st.session_state.user_profile,
+            {'riasec': st.session_state.riasec_answers, 'skills': st.session_state.skills_answers},
+            st.session_state.recommended_careers,
+            session_id=st.session_state.session_id,
+            org=st.session_state.get('tenant'),
+            persona=st.session_state.selected_persona
+        )
+        
+        # Navigate based on persona
+        if st.session_state.selected_persona == 'individual':
+            st.session_state.current_step = 'results'
+        elif st.session_state.selected_persona == 'coach':
+            st.session_state.current_step = 'coaching'
+        else:
+            st.session_state.current_step = 'manager'
+        
+        st.session_state.game_progress = 100
+        st.rerun()
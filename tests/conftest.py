@@ -0,0 +1,25 @@
+import pytest
+
+import data.careers
+import utils.catalog_loader
+from utils.match_cache import fit_cache, match_cache
+from utils.scoring_engine import get_compiled_catalog, invalidate_compiled_catalog
+
+
+def _reset():
+    invalidate_compiled_catalog()
+    match_cache.clear()
+    fit_cache.clear()
+
+
+@pytest.fixture
+def serve_catalog(monkeypatch):
+    """Function that makes get_compiled_catalog() serve a list of career dicts"""
+    def serve(careers):
+        monkeypatch.setattr(data.careers, 'careers', careers)
+        monkeypatch.setattr(utils.catalog_loader, 'catalog_path', lambda: None)
+        _reset()
+        return get_compiled_catalog()
+
+    yield serve
+    _reset()
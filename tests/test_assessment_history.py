@@ -0,0 +1,56 @@
+import random
+
+from utils.assessment_history import AssessmentHistory
+
+
+def submissions(count, seed=0):
+    rng = random.Random(seed)
+    skills = {}
+    for i in range(count):
+        kind = rng.choice(['riasec', 'skills', 'values'])
+        if kind == 'riasec':
+            data = {'realistic': rng.randint(1, 5), 'social': rng.randint(1, 5)}
+        elif kind == 'skills':
+            skills = dict(skills)
+            skills[rng.choice(['Programming', 'Writing', 'Teaching'])] = rng.randint(1, 5)
+            if len(skills) > 1 and rng.random() < 0.3:
+                del skills[next(iter(skills))]
+            data = skills
+        else:
+            data = rng.sample(['Creativity', 'Leadership', 'Recognition', 'Autonomy'], 2)
+        yield kind, data
+
+
+def test_entries_replay_the_retained_submissions():
+    history = AssessmentHistory(capacity=8)
+    recorded = []
+    for kind, data in submissions(50):
+        history.record(kind, data)
+        recorded.append((kind, dict(data) if isinstance(data, dict) else list(data)))
+        retained = recorded[-8:]
+        assert len(history) == len(retained)
+        assert [(entry['type'], entry['data']) for entry in history.entries()] == retained
+
+
+def test_latest_is_the_last_submission_of_each_type():
+    history = AssessmentHistory(capacity=4)
+    last = {}
+    for kind, data in submissions(40, seed=1):
+        history.record(kind, data)
+        last[kind] = data
+        for type_, data in last.items():
+            latest = history.latest(type_)
+            assert (dict(latest) if isinstance(data, dict) else list(latest)) == data
+    assert history.latest('coaching') is None
+
+
+def test_unchanged_submission_stores_an_empty_delta():
+    history = AssessmentHistory()
+    history.record('riasec', {'social': 4})
+    history.record('riasec', {'social': 4})
+    history.record('values', ['Creativity'])
+    history.record('values', ['Creativity'])
+    first, second, third, fourth = history._records
+    assert second.changes == {} and second.removed == ()
+    assert fourth.changes is None
+    assert [entry['data'] for entry in history.entries()] == [{'social': 4}] * 2 + [['Creativity']] * 2
@@ -0,0 +1,116 @@
+import sqlite3
+import statistics
+
+import pytest
+
+from utils.assessment_store import AssessmentStore
+from utils.scoring_engine import RIASEC_TYPES
+
+ORGS = ['acme', 'beta']
+
+
+def profile(i):
+    return {
+        'name': f'user{i % 3}',
+        'riasecScores': {riasec_type: (i * 7 + j) % 5 + 1 for j, riasec_type in enumerate(RIASEC_TYPES)},
+        'workValues': ['Creativity', 'Autonomy'] if i % 2 else ['Leadership']
+    }
+
+
+def save(store, i):
+    careers = [{'id': f'c{i % 4}', 'title': f'Career {i % 4}', 'matchScore': 60 + i % 30}]
+    answers = {'riasec': {'r1': 4}, 'skills': {'Programming': i % 5 + 1}}
+    store.save(profile(i), answers, careers, f'session{i % 5}', ORGS[i % 2], persona='individual')
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AssessmentStore(str(tmp_path / 'assessments.db'))
+    yield store
+    store.close()
+
+
+def stored_population(path, org=None):
+    conn = sqlite3.connect(path)
+    where, params = ("WHERE org = ?", [org]) if org else ("", [])
+    assessments, users = conn.execute(
+        f"SELECT COUNT(*), COUNT(DISTINCT org || '|' || session_id) FROM assessments {where}", params
+    ).fetchone()
+    riasec = {
+        riasec_type: [row[0] for row in conn.execute(f"SELECT {riasec_type} FROM assessments {where}", params)]
+        for riasec_type in RIASEC_TYPES
+    }
+    conn.close()
+    return assessments, users, riasec
+
+
+def assert_population(store, org=None):
+    population = store.population(org)
+    assessments, users, riasec = stored_population(store.path, org)
+    assert (population['assessments'], population['users']) == (assessments, users)
+    for riasec_type, scores in riasec.items():
+        stats = population['riasec'][riasec_type]
+        assert stats.count == len(scores)
+        assert stats.mean == pytest.approx(statistics.fmean(scores))
+        assert stats.variance == pytest.approx(statistics.pvariance(scores))
+
+
+def test_writer_saves_assessments_and_aggregates(store):
+    for i in range(40):
+        save(store, i)
+    store.flush()
+    assert (store.written, store.failed, store.pending()) == (40, 0, 0)
+    assert store.orgs() == ORGS
+    for org in [None] + ORGS:
+        assert_population(store, org)
+    population = store.population('acme')
+    assert sum(population['skills']['Programming'].values()) == 20
+    assert dict(population['values']) == {'Leadership': 20}
+    assert len(store.recent(limit=5)) == 5
+
+
+def test_users_are_counted_by_session(store):
+    for i in range(10):
+        save(store, i)
+    store.flush()
+    # Five sessions spread over two organizations, three display names
+    assert store.population()['users'] == len({(f'session{i % 5}', ORGS[i % 2]) for i in range(10)})
+
+
+def test_failed_batch_does_not_stop_the_writer(store):
+    save(store, 0)
+    store.flush()
+    store._queue.put(('not an assessment',))
+    store.flush()
+    save(store, 1)
+    store.flush()
+    assert (store.written, store.failed) == (2, 1)
+    assert store.last_error.startswith('ValueError')
+
+
+def test_dead_writer_is_replaced(store):
+    save(store, 0)
+    store.close()
+    save(store, 1)
+    store.flush()
+    assert store.written == 2
+
+
+def test_aggregates_are_backfilled_on_open(store):
+    for i in range(25):
+        save(store, i)
+    store.close()
+    before = {org: store.population(org) for org in [None] + ORGS}
+
+    conn = sqlite3.connect(store.path)
+    with conn:
+        for table in ('org_totals', 'riasec_stats', 'skill_histogram', 'value_counts', 'top_match_counts'):
+            conn.execute(f"DELETE FROM {table}")
+    conn.close()
+
+    reopened = AssessmentStore(store.path)
+    for org, population in before.items():
+        after = reopened.population(org)
+        assert {key: value for key, value in after.items() if key != 'riasec'} == \
+            {key: value for key, value in population.items() if key != 'riasec'}
+        assert_population(reopened, org)
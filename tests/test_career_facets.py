@@ -0,0 +1,95 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from utils.career_facets import EDUCATION_LEVELS, CareerFacets, parse_education, parse_growth, parse_salary
+from utils.career_store import CareerStore
+
+EDUCATIONS = ["Bachelor's degree in CS", 'Master of Science', 'PhD required', 'High school diploma',
+              'State license', "Associate's degree", 'Varies']
+
+
+def test_parse_salary():
+    assert parse_salary('$70,000 - $150,000') == (70000, 150000)
+    assert parse_salary('80k-120k') == (80000, 120000)
+    assert parse_salary('$1.2M') == (1200000, 1200000)
+    assert all(math.isnan(value) for value in parse_salary('Competitive'))
+    assert all(math.isnan(value) for value in parse_salary(None))
+
+
+def test_parse_growth():
+    assert parse_growth('Excellent - 22% growth expected') == 22
+    assert parse_growth('Declining (-3.5%)') == -3.5
+    assert math.isnan(parse_growth('Stable'))
+
+
+def test_parse_education():
+    assert EDUCATION_LEVELS[int(parse_education("Bachelor's or Master's degree"))] == "Bachelor's degree"
+    assert EDUCATION_LEVELS[int(parse_education('PhD required'))] == 'Doctoral degree'
+    assert EDUCATION_LEVELS[int(parse_education('Professional license'))] == 'Certificate or license'
+    assert EDUCATION_LEVELS[int(parse_education('High school diploma'))] == 'High school'
+    assert math.isnan(parse_education('Varies'))
+
+
+def generate_careers(size, seed=0):
+    rng = random.Random(seed)
+    careers = []
+    for i in range(size):
+        career = {'id': f'c{i}', 'title': f'Career {i}', 'primary_type': 'social', 'required_skills': []}
+        if rng.random() < 0.9:
+            career['salary_range'] = f'${rng.randint(20, 120)},000 - ${rng.randint(121, 250)},000'
+        if rng.random() < 0.9:
+            career['growth_outlook'] = f'{rng.randint(-10, 30)}% growth'
+        career['education'] = rng.choice(EDUCATIONS)
+        careers.append(career)
+    return careers
+
+
+@pytest.fixture(scope='module')
+def careers():
+    return generate_careers(2000)
+
+
+@pytest.fixture(scope='module')
+def facets(careers):
+    return CareerFacets(CareerStore.from_records(careers))
+
+
+def brute_force(careers, min_salary=None, min_growth=None, max_education=None):
+    rows = []
+    for row, career in enumerate(careers):
+        salary = parse_salary(career.get('salary_range'))[0]
+        growth = parse_growth(career.get('growth_outlook'))
+        education = parse_education(career.get('education'))
+        if min_salary is not None and not salary >= min_salary:
+            continue
+        if min_growth is not None and not growth >= min_growth:
+            continue
+        if max_education is not None and not education <= max_education:
+            continue
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'min_salary': 60000},
+    {'min_salary': 119000},
+    {'min_growth': 0},
+    {'min_growth': 29},
+    {'max_education': 3},
+    {'min_salary': 100000, 'min_growth': 25, 'max_education': 3},
+    {'min_salary': 50000, 'min_growth': -5},
+    {'min_salary': 10 ** 9},
+])
+def test_filter_matches_brute_force(careers, facets, filters):
+    assert facets.filter(**filters).tolist() == brute_force(careers, **filters)
+
+
+def test_limits_ignore_unknown_values(careers, facets):
+    growth = [parse_growth(career.get('growth_outlook')) for career in careers]
+    assert facets.limits('growth') == (np.nanmin(growth), np.nanmax(growth))
+    empty = CareerFacets(CareerStore.from_records([{'id': 'x', 'title': 'X', 'primary_type': 'social', 'required_skills': []}]))
+    assert empty.limits('salary_min') is None
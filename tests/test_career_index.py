@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import utils.career_matcher
+from benchmarks.synthetic import generate_catalog, generate_profiles
+from utils.career_index import CareerIndex, get_career_index
+from utils.career_matcher import calculate_career_matches
+from utils.career_store import CareerStore
+from utils.scoring_engine import CompiledCatalog, round_scores, top_k_indices
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    return CompiledCatalog(CareerStore.from_records(generate_catalog(3000, seed=1)))
+
+
+def profiles():
+    sparse = generate_profiles(1, seed=3)[0]
+    sparse.update(skillsConfidence={}, workValues=[])
+    return generate_profiles(20, seed=2) + [sparse]
+
+
+def full_scan(catalog, profile, top_k):
+    components = catalog.score_components(profile)
+    scores = round_scores(components[0] + components[1] + components[2])
+    rows = top_k_indices(scores, top_k)
+    return rows, scores[rows]
+
+
+@pytest.mark.parametrize('leaf_size', [8, 128])
+@pytest.mark.parametrize('top_k', [1, 10])
+def test_exact_search_matches_full_scan(catalog, leaf_size, top_k):
+    index = CareerIndex(catalog, leaf_size)
+    for profile in profiles():
+        rows, scores, components = index.search(profile, top_k, exact=True)
+        expected_rows, expected_scores = full_scan(catalog, profile, top_k)
+        assert rows.tolist() == expected_rows.tolist()
+        assert scores.tolist() == expected_scores.tolist()
+        np.testing.assert_allclose(components, catalog.score_components(profile)[:, rows])
+
+
+def test_exact_search_with_tiny_shortlist_matches_full_scan(catalog):
+    index = CareerIndex(catalog)
+    for profile in profiles():
+        rows, scores, _ = index.search(profile, 10, exact=True, shortlist=1)
+        assert rows.tolist() == full_scan(catalog, profile, 10)[0].tolist()
+
+
+def test_approximate_search_recall(catalog):
+    index = CareerIndex(catalog)
+    found = []
+    for profile in profiles():
+        rows, _, _ = index.search(profile, 10, exact=False)
+        found.append(len(set(rows.tolist()) & set(full_scan(catalog, profile, 10)[0].tolist())) / 10)
+    assert np.mean(found) >= 0.8
+
+
+def test_matcher_searches_the_index_only_when_approximate(serve_catalog, monkeypatch):
+    catalog = serve_catalog(generate_catalog(3000, seed=1))
+    monkeypatch.setattr(utils.career_matcher, 'INDEX_MIN_CATALOG_SIZE', 1000)
+    profile = profiles()[0]
+    approx = calculate_career_matches(profile, exact=False)
+    rows = get_career_index().search(profile, 10, exact=False)[0]
+    assert [match['id'] for match in approx] == [catalog.careers[int(row)]['id'] for row in rows]
+    exact = calculate_career_matches(profile)
+    assert [match['id'] for match in exact] == [catalog.careers[int(row)]['id'] for row in full_scan(catalog, profile, 10)[0]]
@@ -0,0 +1,53 @@
+import json
+
+import numpy as np
+
+from benchmarks.synthetic import generate_catalog
+from utils.career_store import CareerStore
+from utils.catalog_loader import load_catalog, load_compiled_catalog
+from utils.scoring_engine import CompiledCatalog
+
+
+def write_catalog(path, careers):
+    with open(path, 'w', encoding='utf-8') as f:
+        for career in careers:
+            f.write(json.dumps(career) + '\n')
+
+
+def test_compiled_matrices_are_memory_mapped_from_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('CAREER_CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'catalog.jsonl'
+    careers = generate_catalog(300, seed=4)
+    write_catalog(path, careers)
+
+    catalog = load_compiled_catalog(str(path), version=3)
+    expected = CompiledCatalog(CareerStore.from_records(careers))
+    assert catalog.version == 3 and catalog.source is load_catalog(str(path))
+    for name in CompiledCatalog.MATRICES:
+        assert isinstance(getattr(catalog, name), np.memmap)
+        np.testing.assert_array_equal(getattr(catalog, name), getattr(expected, name))
+
+
+def test_cache_is_rebuilt_for_a_new_revision(tmp_path, monkeypatch):
+    monkeypatch.setenv('CAREER_CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'catalog.jsonl'
+    write_catalog(path, generate_catalog(100, seed=1))
+    first = load_compiled_catalog(str(path))
+    careers = generate_catalog(150, seed=2)
+    write_catalog(path, careers)
+    second = load_compiled_catalog(str(path))
+    assert (first.size, second.size) == (100, 150)
+    np.testing.assert_array_equal(second.skill_matrix, CompiledCatalog(CareerStore.from_records(careers)).skill_matrix)
+    assert len(list((tmp_path / 'cache').iterdir())) == 1
+
+
+def test_matrices_with_other_registry_columns_are_recompiled():
+    store = CareerStore.from_records(generate_catalog(50, seed=5))
+    arrays = CompiledCatalog(store).to_arrays()
+    arrays['skill_matrix'] = np.zeros_like(arrays['skill_matrix'])
+    assert not CompiledCatalog.from_arrays(store, arrays).skill_matrix.any()
+
+    # Value columns saved in another order no longer line up with this process's IDs
+    arrays['value_columns.data'] = arrays['value_columns.data'][::-1].copy()
+    catalog = CompiledCatalog.from_arrays(store, arrays)
+    np.testing.assert_array_equal(catalog.skill_matrix, CompiledCatalog(store).skill_matrix)
@@ -0,0 +1,68 @@
+import json
+import os
+import threading
+
+import pytest
+
+from utils import scoring_weights
+from utils.file_store import ReloadingFile, atomic_write
+from utils.scoring_engine import DEFAULT_WEIGHTS
+
+
+def test_atomic_write_replaces_the_file_only_when_complete(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('old')
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path), prefix='.data-', suffix='.json') as f:
+            f.write('partial')
+            raise RuntimeError
+    assert path.read_text() == 'old'
+    with atomic_write(str(path), prefix='.data-', suffix='.json') as f:
+        f.write('new')
+    assert path.read_text() == 'new'
+    assert os.listdir(tmp_path) == ['data.json']
+
+
+def test_reloading_file_rereads_only_changed_files(tmp_path):
+    path = tmp_path / 'data.json'
+    loads = []
+    source = ReloadingFile(lambda: str(path), lambda p: loads.append(p) or json.loads(open(p).read()), 'default')
+    assert source.get() == 'default'
+    path.write_text('[1]')
+    assert source.get() == [1]
+    assert source.get() is source.get()
+    path.write_text('[1, 2]')
+    assert source.get() == [1, 2]
+    assert len(loads) == 2
+    path.unlink()
+    assert source.get() == 'default'
+
+
+@pytest.fixture
+def weights_file(tmp_path, monkeypatch):
+    path = tmp_path / 'weights.json'
+    monkeypatch.setenv('SCORING_WEIGHTS_PATH', str(path))
+    return path
+
+
+@pytest.mark.parametrize('contents', ['{not json', '[]', '{"acme": [1, 2]}', '{"acme": {"riasec": 50}}'])
+def test_bad_weights_file_falls_back_to_default_weights(weights_file, contents):
+    weights_file.write_text(contents)
+    assert scoring_weights.get_weights('acme') == DEFAULT_WEIGHTS
+    assert scoring_weights.list_tenants() == []
+
+
+def test_concurrent_saves_keep_every_tenant(weights_file):
+    weights = [(10 + i, 60 - i, 30, 0.7, 0.3) for i in range(20)]
+    threads = [
+        threading.Thread(target=scoring_weights.set_weights, args=(f'tenant{i}', weights[i]))
+        for i in range(len(weights))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert scoring_weights.list_tenants() == sorted(f'tenant{i}' for i in range(len(weights)))
+    scoring_weights.reset_weights('tenant3')
+    assert scoring_weights.get_weights('tenant3') == DEFAULT_WEIGHTS
+    assert tuple(scoring_weights.get_weights('tenant4')) == weights[4]
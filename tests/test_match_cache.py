@@ -0,0 +1,56 @@
+from benchmarks.synthetic import generate_catalog, generate_profiles
+from utils.career_matcher import calculate_career_matches
+from utils.match_cache import match_cache
+from utils.scoring_engine import ScoringWeights, combine_fits, invalidate_compiled_catalog, round_scores, top_k_indices
+
+PROFILE = generate_profiles(1, seed=7)[0]
+
+
+def expected(catalog, weights=None):
+    components = combine_fits(catalog.score_fits(PROFILE), *([weights] if weights else []))
+    scores = round_scores(components[0] + components[1] + components[2])
+    rows = top_k_indices(scores)
+    return [(catalog.careers[int(row)]['id'], int(scores[row])) for row in rows]
+
+
+def ranked(matches):
+    return [(match['id'], match['matchScore']) for match in matches]
+
+
+def test_repeated_match_is_served_from_cache(serve_catalog):
+    serve_catalog(generate_catalog(200, seed=1))
+    first = calculate_career_matches(PROFILE)
+    hits = match_cache.hits
+    assert ranked(calculate_career_matches(PROFILE)) == ranked(first)
+    assert match_cache.hits == hits + 1
+
+
+def test_new_weights_are_not_served_stale_matches(serve_catalog):
+    catalog = serve_catalog(generate_catalog(200, seed=1))
+    weights = ScoringWeights(10, 80, 10, 0.5, 0.5)
+    default = ranked(calculate_career_matches(PROFILE))
+    reweighted = ranked(calculate_career_matches(PROFILE, weights=weights))
+    assert default == expected(catalog)
+    assert reweighted == expected(catalog, weights)
+    assert reweighted != default
+    assert ranked(calculate_career_matches(PROFILE)) == default
+
+
+def test_new_catalog_version_is_not_served_stale_matches(serve_catalog):
+    first = serve_catalog(generate_catalog(200, seed=1))
+    before = ranked(calculate_career_matches(PROFILE))
+    second = serve_catalog(generate_catalog(200, seed=2))
+    assert second.version != first.version
+    after = ranked(calculate_career_matches(PROFILE))
+    assert before == expected(first)
+    assert after == expected(second)
+    assert after != before
+
+
+def test_catalog_edited_in_place_is_rescored_after_invalidation(serve_catalog):
+    careers = generate_catalog(200, seed=1)
+    serve_catalog(careers)
+    best = calculate_career_matches(PROFILE)[0]['id']
+    careers[:] = [career for career in careers if career['id'] != best]
+    invalidate_compiled_catalog()
+    assert best not in [match['id'] for match in calculate_career_matches(PROFILE)]
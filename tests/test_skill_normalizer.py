@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from utils.interning import skill_registry
+from utils.skill_normalizer import normalize_skill, skill_normalizer
+
+
+def resolved(name):
+    return {skill_registry.name(id_): round(weight, 2) for id_, weight in skill_normalizer.resolve(name)}
+
+
+def test_normalize_skill():
+    assert normalize_skill('  Problem-Solving ') == 'problem solving'
+    assert normalize_skill('R&D') == 'r and d'
+    assert normalize_skill('C++ / C#') == 'c++ c#'
+
+
+@pytest.mark.parametrize('name', ['Programming', 'programming', 'Time-Management', 'customer  service'])
+def test_assessed_skills_map_to_themselves(name):
+    assert list(resolved(name).values()) == [1.0]
+    assert normalize_skill(list(resolved(name))[0]) == normalize_skill(name)
+
+
+def test_synonyms_use_their_table_weights():
+    assert resolved('Machine Learning') == {'Programming': 0.5, 'Data Analysis': 0.5}
+    assert resolved('coding') == {'Programming': 1.0}
+    assert resolved('Physical Stamina') == {}
+
+
+@pytest.mark.parametrize('name, skill', [
+    ('Programing', 'Programming'),
+    ('Time Managment', 'Time Management'),
+    ('Team Leadership', 'Leadership'),
+    ('Project Planning', 'Planning'),
+])
+def test_similar_names_map_to_the_assessed_skill(name, skill):
+    assert list(resolved(name)) == [skill]
+
+
+@pytest.mark.parametrize('name', ['Sales Management', 'Budget Management', 'Underwater Welding'])
+def test_generic_or_unrelated_names_stay_unmapped(name):
+    assert resolved(name) == {}
+
+
+def test_weights_of_a_name_add_up_to_at_most_one():
+    for name in ['Data Analytics', 'Data Science', 'Programing', 'Creative Design']:
+        assert sum(weight for _, weight in skill_normalizer.resolve(name)) <= 1 + 1e-9
+
+
+def test_table_agrees_with_resolve():
+    for name in ['Coding', 'Programing', 'Sales Management', 'Statistics']:
+        skill_registry.intern(name)
+    width = len(skill_registry)
+    offsets, ids, weights = skill_normalizer.table(width)
+    assert len(offsets) == width + 1
+    assert ids.max() < skill_normalizer.assessed_width
+    for id_ in range(width):
+        mapped = list(zip(ids[offsets[id_]:offsets[id_ + 1]].tolist(), weights[offsets[id_]:offsets[id_ + 1]].tolist()))
+        assert mapped == skill_normalizer.resolve(skill_registry.name(id_))
+    assert np.all(weights > 0)
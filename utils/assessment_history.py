@@ -0,0 +1,89 @@
+import os
+import time
+from collections import deque, namedtuple
+from datetime import datetime
+
+# Records kept per session; older ones are folded into the per-type base state
+HISTORY_CAPACITY = int(os.getenv('ASSESSMENT_HISTORY_SIZE', '32'))
+
+# One submitted assessment. timestamp is time.monotonic(); changes holds the
+# entries that differ from the previous record of the same type (dict data)
+# or the whole new tuple (list data), and removed the keys that were dropped.
+AssessmentRecord = namedtuple('AssessmentRecord', ['type', 'timestamp', 'changes', 'removed'])
+
+
+def _delta(previous, data):
+    """(changes, removed) that turn previous into data"""
+    if not isinstance(data, dict):
+        data = tuple(data)
+        return (data if data != previous else None), ()
+    previous = previous or {}
+    changes = {key: value for key, value in data.items() if key not in previous or previous[key] != value}
+    removed = tuple(key for key in previous if key not in data)
+    return changes, removed
+
+
+def _apply(state, record):
+    """State of record's type after record, given the state before it"""
+    if not isinstance(record.changes, dict):
+        return state if record.changes is None else record.changes
+    state = dict(state or {})
+    for key in record.removed:
+        del state[key]
+    state.update(record.changes)
+    return state
+
+
+class AssessmentHistory:
+    """Bounded history of submitted assessments for analytics and export
+
+    Records are kept in a ring buffer of at most capacity entries and
+    store only what changed since the previous submission of their type.
+    The latest data of each type is kept whole, so reading it is O(1);
+    when a record falls out of the buffer it is folded into a base state,
+    from which entries() replays the deltas.
+    """
+
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.capacity = capacity
+        self._records = deque()
+        self._base = {}
+        self._latest = {}
+        # Offset from the monotonic clock to wall-clock time, for display
+        self._wall_offset = time.time() - time.monotonic()
+
+    def __len__(self):
+        return len(self._records)
+
+    def record(self, type_, data):
+        """Append a submission of type_ with its full data (copied as a delta)"""
+        previous = self._latest.get(type_)
+        changes, removed = _delta(previous, data)
+        if len(self._records) >= self.capacity:
+            oldest = self._records.popleft()
+            self._base[oldest.type] = _apply(self._base.get(oldest.type), oldest)
+        record = AssessmentRecord(type_, time.monotonic(), changes, removed)
+        self._records.append(record)
+        self._latest[type_] = _apply(previous, record)
+
+    def latest(self, type_):
+        """Most recent data of type_ (read-only; a tuple for list data), or None"""
+        return self._latest.get(type_)
+
+    def timestamp(self, record):
+        """Wall-clock datetime of a record"""
+        return datetime.fromtimestamp(self._wall_offset + record.timestamp)
+
+    def entries(self):
+        """Retained records, oldest first, as {'type', 'data', 'timestamp'} dicts with full data"""
+        states = dict(self._base)
+        entries = []
+        for record in self._records:
+            states[record.type] = _apply(states.get(record.type), record)
+            data = states[record.type]
+            entries.append({
+                'type': record.type,
+                'data': dict(data) if isinstance(data, dict) else list(data or ()),
+                'timestamp': self.timestamp(record).isoformat(timespec='seconds')
+            })
+        return entries
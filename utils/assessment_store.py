@@ -0,0 +1,419 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from utils.running_stats import RunningStats
+from utils.scoring_engine import RIASEC_TYPES
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'assessments.db')
+
+# Stored as the database's user_version; bump when the aggregates are computed
+# differently so existing databases rebuild them
+AGGREGATES_VERSION = 1
+
+# Assessments written per transaction, and how long the writer waits to fill a batch
+BATCH_SIZE = 64
+FLUSH_INTERVAL = 0.5
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS assessments (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    user_name TEXT NOT NULL,
+    org TEXT NOT NULL,
+    persona TEXT,
+    created_at REAL NOT NULL,
+    {', '.join(f'{riasec_type} REAL NOT NULL' for riasec_type in RIASEC_TYPES)}
+);
+CREATE TABLE IF NOT EXISTS responses (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id),
+    kind TEXT NOT NULL,
+    item TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recommendations (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id),
+    rank INTEGER NOT NULL,
+    career_id TEXT,
+    title TEXT NOT NULL,
+    match_score REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS org_totals (
+    org TEXT PRIMARY KEY,
+    assessments INTEGER NOT NULL,
+    users INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS riasec_stats (
+    org TEXT NOT NULL,
+    riasec_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    PRIMARY KEY (org, riasec_type)
+);
+CREATE TABLE IF NOT EXISTS skill_histogram (
+    org TEXT NOT NULL,
+    skill TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (org, skill, level)
+);
+CREATE TABLE IF NOT EXISTS value_counts (
+    org TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (org, value)
+);
+CREATE TABLE IF NOT EXISTS top_match_counts (
+    org TEXT NOT NULL,
+    title TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    score_total REAL NOT NULL,
+    PRIMARY KEY (org, title)
+);
+CREATE INDEX IF NOT EXISTS assessments_by_user ON assessments (user_name, created_at);
+CREATE INDEX IF NOT EXISTS assessments_by_org ON assessments (org, created_at);
+CREATE INDEX IF NOT EXISTS assessments_by_time ON assessments (created_at);
+CREATE INDEX IF NOT EXISTS assessments_by_session ON assessments (session_id, org);
+CREATE INDEX IF NOT EXISTS responses_by_assessment ON responses (assessment_id);
+CREATE INDEX IF NOT EXISTS responses_by_item ON responses (kind, item);
+CREATE INDEX IF NOT EXISTS recommendations_by_assessment ON recommendations (assessment_id, rank);
+"""
+
+_INSERT_ASSESSMENT = (
+    f"INSERT INTO assessments (session_id, user_name, org, persona, created_at, {', '.join(RIASEC_TYPES)}) "
+    f"VALUES ({', '.join('?' * (5 + len(RIASEC_TYPES)))})"
+)
+_INSERT_RESPONSE = "INSERT INTO responses (assessment_id, kind, item, value) VALUES (?, ?, ?, ?)"
+_INSERT_RECOMMENDATION = (
+    "INSERT INTO recommendations (assessment_id, rank, career_id, title, match_score) VALUES (?, ?, ?, ?, ?)"
+)
+# Users are sessions: display names are free text, so they neither identify nor separate people
+_FIND_USER = "SELECT 1 FROM assessments WHERE session_id = ? AND org = ? LIMIT 1"
+
+# Running aggregates, kept per organization; counts are added to, RIASEC stats replaced after merging
+_AGGREGATE_TABLES = ('org_totals', 'riasec_stats', 'skill_histogram', 'value_counts', 'top_match_counts')
+_ADD_TOTALS = (
+    "INSERT INTO org_totals (org, assessments, users) VALUES (?, ?, ?) ON CONFLICT (org) DO UPDATE SET "
+    "assessments = assessments + excluded.assessments, users = users + excluded.users"
+)
+_REPLACE_RIASEC_STATS = "INSERT OR REPLACE INTO riasec_stats (org, riasec_type, count, mean, m2) VALUES (?, ?, ?, ?, ?)"
+_ADD_SKILL_LEVELS = (
+    "INSERT INTO skill_histogram (org, skill, level, count) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (org, skill, level) DO UPDATE SET count = count + excluded.count"
+)
+_ADD_VALUES = (
+    "INSERT INTO value_counts (org, value, count) VALUES (?, ?, ?) "
+    "ON CONFLICT (org, value) DO UPDATE SET count = count + excluded.count"
+)
+_ADD_TOP_MATCHES = (
+    "INSERT INTO top_match_counts (org, title, count, score_total) VALUES (?, ?, ?, ?) ON CONFLICT (org, title) "
+    "DO UPDATE SET count = count + excluded.count, score_total = score_total + excluded.score_total"
+)
+
+# Queued by close() to stop the writer
+_STOP = object()
+
+
+def db_path():
+    return os.getenv('ASSESSMENT_DB_PATH') or DEFAULT_DB_PATH
+
+
+def _where(org=None, user=None):
+    """WHERE clause and parameters for the optional assessment filters"""
+    clauses, params = [], []
+    for column, value in (('org', org), ('user_name', user)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ''), params
+
+
+class _Aggregates:
+    """Changes to the running aggregates from a batch of assessments, written in its transaction"""
+
+    def __init__(self):
+        self.totals = Counter()
+        self.users = Counter()
+        self.riasec = {}
+        self.skill_levels = Counter()
+        self.values = Counter()
+        self.top_matches = Counter()
+        self.top_scores = Counter()
+
+    def add(self, assessment, responses, recommendations, new_user):
+        org = assessment[2]
+        self.totals[org] += 1
+        self.users[org] += new_user
+        for riasec_type, score in zip(RIASEC_TYPES, assessment[5:]):
+            self.riasec.setdefault((org, riasec_type), RunningStats()).add(score)
+        for kind, item, value in responses:
+            if kind == 'skills':
+                self.skill_levels[org, item, int(value)] += 1
+            elif kind == 'values':
+                self.values[org, item] += 1
+        for rank, _, title, score in recommendations:
+            if rank == 1:
+                self.top_matches[org, title] += 1
+                self.top_scores[org, title] += score
+
+    def write(self, conn):
+        for org, count in self.totals.items():
+            conn.execute(_ADD_TOTALS, (org, count, self.users[org]))
+        # Welford state can't be added in SQL, so stored stats are merged with the batch's here
+        for org in self.totals:
+            for riasec_type, count, mean, m2 in conn.execute(
+                    "SELECT riasec_type, count, mean, m2 FROM riasec_stats WHERE org = ?", (org,)).fetchall():
+                self.riasec[org, riasec_type] = RunningStats(count, mean, m2).merge(self.riasec[org, riasec_type])
+        conn.executemany(_REPLACE_RIASEC_STATS, (
+            (org, riasec_type, stats.count, stats.mean, stats.m2) for (org, riasec_type), stats in self.riasec.items()
+        ))
+        conn.executemany(_ADD_SKILL_LEVELS, ((*key, count) for key, count in self.skill_levels.items()))
+        conn.executemany(_ADD_VALUES, ((*key, count) for key, count in self.values.items()))
+        conn.executemany(_ADD_TOP_MATCHES, (
+            (*key, count, self.top_scores[key]) for key, count in self.top_matches.items()
+        ))
+
+
+class AssessmentStore:
+    """Completed assessments persisted to SQLite for analytics across sessions
+
+    save() only snapshots the rows and queues them; a background thread
+    writes queued assessments in batches, one transaction each, so the
+    request path never waits on the database or on fsync. The database
+    runs in WAL mode, so analytics queries read while the writer commits.
+
+    The same transaction updates running aggregates per organization
+    (counts, RIASEC mean and variance, skill confidence histograms, value
+    and top match counts), so population() reads a fixed amount of data
+    however many assessments are stored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.written = 0
+        self.failed = 0
+        self.last_error = None
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(SCHEMA)
+            # Databases written before the aggregates existed, or by an older version of them
+            stored = conn.execute("SELECT EXISTS (SELECT 1 FROM assessments)").fetchone()[0]
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            aggregated = conn.execute("SELECT EXISTS (SELECT 1 FROM org_totals)").fetchone()[0]
+            if stored and (version < AGGREGATES_VERSION or not aggregated):
+                self._rebuild_aggregates(conn)
+            conn.execute(f"PRAGMA user_version = {AGGREGATES_VERSION}")
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def save(self, profile, answers, careers, session_id, org, persona=None):
+        """Queue a completed assessment for writing and return at once
+
+        answers maps 'riasec' and 'skills' to their raw {item: rating}
+        responses; the work values are stored by rank.
+        """
+        assessment = (
+            session_id, profile.get('name') or '', org, persona, time.time(),
+            *(float(profile['riasecScores'].get(riasec_type, 0)) for riasec_type in RIASEC_TYPES)
+        )
+        responses = [
+            (kind, str(item), float(value)) for kind in ('riasec', 'skills') for item, value in answers.get(kind, {}).items()
+        ] + [('values', name, float(rank)) for rank, name in enumerate(profile['workValues'], 1)]
+        recommendations = [
+            (rank, career.get('id'), career['title'], float(career['matchScore'])) for rank, career in enumerate(careers, 1)
+        ]
+        self._start_writer()
+        self._queue.put((assessment, responses, recommendations))
+
+    def _start_writer(self):
+        # Also replaces a writer that died, so queued assessments are never stranded
+        if self._writer is None or not self._writer.is_alive():
+            with self._lock:
+                if self._writer is None or not self._writer.is_alive():
+                    if self._writer is None:
+                        atexit.register(self.close)
+                    self._writer = threading.Thread(target=self._write_batches, name='assessment-store', daemon=True)
+                    self._writer.start()
+
+    def _write_batches(self):
+        conn = None
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                stopping = True
+            assessments = [item for item in batch if item is not _STOP]
+            try:
+                if conn is None:
+                    conn = self._connect()
+                with conn:
+                    aggregates = _Aggregates()
+                    for assessment, responses, recommendations in assessments:
+                        new_user = conn.execute(_FIND_USER, (assessment[0], assessment[2])).fetchone() is None
+                        assessment_id = conn.execute(_INSERT_ASSESSMENT, assessment).lastrowid
+                        conn.executemany(_INSERT_RESPONSE, ((assessment_id, *row) for row in responses))
+                        conn.executemany(_INSERT_RECOMMENDATION, ((assessment_id, *row) for row in recommendations))
+                        aggregates.add(assessment, responses, recommendations, new_user)
+                    aggregates.write(conn)
+                self.written += len(assessments)
+            except Exception as e:
+                # Counted and dropped, so one bad batch never stops the writer
+                self.failed += len(assessments)
+                self.last_error = f"{type(e).__name__}: {e}"
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        if conn is not None:
+            conn.close()
+
+    @staticmethod
+    def _rebuild_aggregates(conn):
+        """Recompute the running aggregates from the stored assessments"""
+        with conn:
+            for table in _AGGREGATE_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            conn.execute(
+                "INSERT INTO org_totals (org, assessments, users) "
+                "SELECT org, COUNT(*), COUNT(DISTINCT session_id) FROM assessments GROUP BY org"
+            )
+            riasec = {}
+            for org, *scores in conn.execute(f"SELECT org, {', '.join(RIASEC_TYPES)} FROM assessments"):
+                for riasec_type, score in zip(RIASEC_TYPES, scores):
+                    riasec.setdefault((org, riasec_type), RunningStats()).add(score)
+            conn.executemany(_REPLACE_RIASEC_STATS, (
+                (org, riasec_type, stats.count, stats.mean, stats.m2) for (org, riasec_type), stats in riasec.items()
+            ))
+            joined = "FROM responses JOIN assessments ON assessments.id = responses.assessment_id"
+            conn.execute(
+                "INSERT INTO skill_histogram (org, skill, level, count) "
+                f"SELECT org, item, CAST(value AS INTEGER), COUNT(*) {joined} WHERE kind = 'skills' "
+                "GROUP BY org, item, CAST(value AS INTEGER)"
+            )
+            conn.execute(
+                f"INSERT INTO value_counts (org, value, count) SELECT org, item, COUNT(*) {joined} "
+                "WHERE kind = 'values' GROUP BY org, item"
+            )
+            conn.execute(
+                "INSERT INTO top_match_counts (org, title, count, score_total) "
+                "SELECT org, title, COUNT(*), SUM(match_score) FROM recommendations "
+                "JOIN assessments ON assessments.id = recommendations.assessment_id WHERE rank = 1 GROUP BY org, title"
+            )
+
+    def flush(self):
+        """Block until every queued assessment has been written"""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self):
+        """Write what is queued and stop the writer"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(_STOP)
+            writer.join()
+
+    def pending(self):
+        """Assessments queued but not yet written"""
+        return self._queue.qsize()
+
+    def _query(self, sql, params=()):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def orgs(self):
+        """Organizations with stored assessments"""
+        return [org for org, in self._query("SELECT org FROM org_totals ORDER BY org")]
+
+    def population(self, org=None, top=10):
+        """Running aggregates of every stored assessment, or of one organization's
+
+        Reads only the aggregate tables, whose size depends on the number of
+        organizations, skills, values and careers but not of assessments.
+        Returns a dict with 'assessments' and 'users' (distinct sessions)
+        counts, 'riasec' ({type: RunningStats}), 'skills' ({skill: {level:
+        count}}), and the top 'values' [(value, count)] and 'top_matches'
+        [(title, count, average match score)] by count.
+        """
+        where, params = ("WHERE org = ?", [org]) if org is not None else ("", [])
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            assessments, users = conn.execute(
+                f"SELECT COALESCE(SUM(assessments), 0), COALESCE(SUM(users), 0) FROM org_totals {where}", params
+            ).fetchone()
+            riasec = {riasec_type: RunningStats() for riasec_type in RIASEC_TYPES}
+            for riasec_type, count, mean, m2 in conn.execute(
+                    f"SELECT riasec_type, count, mean, m2 FROM riasec_stats {where}", params):
+                riasec[riasec_type].merge(RunningStats(count, mean, m2))
+            skills = {}
+            for skill, level, count in conn.execute(
+                    f"SELECT skill, level, SUM(count) FROM skill_histogram {where} GROUP BY skill, level ORDER BY skill, level",
+                    params):
+                skills.setdefault(skill, {})[level] = count
+            values = conn.execute(
+                f"SELECT value, SUM(count) FROM value_counts {where} GROUP BY value ORDER BY SUM(count) DESC, value LIMIT ?",
+                params + [top]
+            ).fetchall()
+            top_matches = [
+                (title, count, score_total / count) for title, count, score_total in conn.execute(
+                    f"SELECT title, SUM(count), SUM(score_total) FROM top_match_counts {where} "
+                    f"GROUP BY title ORDER BY SUM(count) DESC, title LIMIT ?", params + [top])
+            ]
+        finally:
+            conn.close()
+        return {
+            'assessments': assessments,
+            'users': users,
+            'riasec': riasec,
+            'skills': skills,
+            'values': values,
+            'top_matches': top_matches
+        }
+
+    def recent(self, org=None, user=None, limit=20):
+        """Latest assessments, newest first, as dicts with their RIASEC scores"""
+        where, params = _where(org, user)
+        columns = ['id', 'user_name', 'org', 'persona', 'created_at', *RIASEC_TYPES]
+        rows = self._query(
+            f"SELECT {', '.join(columns)} FROM assessments {where} ORDER BY created_at DESC LIMIT ?", params + [limit]
+        )
+        return [dict(zip(columns, row)) for row in rows]
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_assessment_store():
+    """Process-wide store for the database at db_path()"""
+    path = db_path()
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = AssessmentStore(path)
+        return _stores[path]
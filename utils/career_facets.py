@@ -0,0 +1,146 @@
+import re
+
+import numpy as np
+
+# Education levels in increasing order; parse_education() returns an index into this
+EDUCATION_LEVELS = ('High school', 'Certificate or license', "Associate's degree", "Bachelor's degree",
+                    "Master's degree", 'Doctoral degree')
+
+# Degree keywords by level, checked before credentials
+_DEGREE_PATTERNS = (
+    (2, re.compile(r'\bassociate')),
+    (3, re.compile(r'\bbachelor|\bundergraduate|\bb\.?sc?\b|\bb\.?a\b')),
+    (4, re.compile(r'\bmaster|\bmba\b|\bm\.?sc?\b|\bm\.?a\b')),
+    (5, re.compile(r'\bdoctora|\bph\.?d|\bm\.?d\b|\bj\.?d\b'))
+)
+_CREDENTIAL_PATTERN = re.compile(r'certificat|licen[cs]e|credential|apprentice')
+_HIGH_SCHOOL_PATTERN = re.compile(r'high school|\bged\b|secondary school')
+
+_AMOUNT_PATTERN = re.compile(r'\$?\s*(\d[\d,]*(?:\.\d+)?)\s*(k|m)?\b', re.IGNORECASE)
+_PERCENT_PATTERN = re.compile(r'(-?\d+(?:\.\d+)?)\s*%')
+
+# Candidate share of the catalog above which filter() scans columns instead of sorting candidates
+SCAN_FRACTION = 1 / 16
+
+
+def parse_salary(text):
+    """(low, high) yearly amounts from a salary range such as '$70,000 - $150,000'; NaN when absent"""
+    if not text:
+        return np.nan, np.nan
+    amounts = []
+    for number, suffix in _AMOUNT_PATTERN.findall(text):
+        amount = float(number.replace(',', ''))
+        if suffix:
+            amount *= 1000 if suffix.lower() == 'k' else 1000000
+        amounts.append(amount)
+    if not amounts:
+        return np.nan, np.nan
+    return min(amounts), max(amounts)
+
+
+def parse_growth(text):
+    """Growth percentage from an outlook such as 'Excellent - 22% growth expected'; NaN when absent"""
+    match = _PERCENT_PATTERN.search(text or '')
+    return float(match.group(1)) if match else np.nan
+
+
+def parse_education(text):
+    """Index into EDUCATION_LEVELS of the lowest degree an education text asks for; NaN when unclear"""
+    text = (text or '').lower()
+    degrees = [level for level, pattern in _DEGREE_PATTERNS if pattern.search(text)]
+    if degrees:
+        return float(min(degrees))
+    if _CREDENTIAL_PATTERN.search(text):
+        return 1.0
+    if _HIGH_SCHOOL_PATTERN.search(text):
+        return 0.0
+    return np.nan
+
+
+def _parsed_column(column, parse):
+    """Parse each distinct string of a categorical column once and spread the results over its rows"""
+    # Trailing entry is for missing values (code -1)
+    parsed = np.array([parse(text) for text in column.table] + [parse(None)], dtype=float)
+    return parsed[column.codes]
+
+
+class CareerFacets:
+    """Numeric salary, growth and education columns of a career store with sorted indexes
+
+    Each column keeps its row order sorted by value (unknown values, NaN,
+    sort last), so a range predicate is two binary searches. filter()
+    takes the narrowest predicate's slice as candidates and checks the
+    others against the columns; when even that slice is a large part of
+    the catalog, comparing whole columns is cheaper.
+    """
+
+    COLUMNS = ('salary_min', 'salary_max', 'growth', 'education')
+
+    def __init__(self, careers):
+        salaries = _parsed_column(careers.salary_ranges, parse_salary)
+        self.salary_min = np.ascontiguousarray(salaries[:, 0])
+        self.salary_max = np.ascontiguousarray(salaries[:, 1])
+        self.growth = _parsed_column(careers.growth_outlooks, parse_growth)
+        self.education = _parsed_column(careers.educations, parse_education)
+        self.size = len(careers)
+
+        self._order = {}
+        self._sorted = {}
+        for name in self.COLUMNS:
+            values = getattr(self, name)
+            order = np.argsort(values, kind='stable')
+            self._order[name] = order
+            self._sorted[name] = values[order]
+
+    def span(self, name, low=None, high=None):
+        """(start, stop) of the rows with low <= value <= high in the column's sorted order"""
+        values = self._sorted[name]
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        # Excludes unknown values, which sort after every number
+        stop = np.searchsorted(values, np.inf if high is None else high, side='right')
+        return int(start), int(stop)
+
+    def filter(self, min_salary=None, min_growth=None, max_education=None):
+        """Catalog rows, in catalog order, whose starting salary, growth and education pass the filters
+
+        Careers with an unknown value are left out by any filter on it.
+        """
+        ranges = {
+            name: bounds for name, bounds in (
+                ('salary_min', (min_salary, None)),
+                ('growth', (min_growth, None)),
+                ('education', (None, max_education))
+            ) if bounds != (None, None)
+        }
+        if not ranges:
+            return np.arange(self.size)
+
+        spans = {name: self.span(name, *bounds) for name, bounds in ranges.items()}
+        narrowest = min(spans, key=lambda name: spans[name][1] - spans[name][0])
+        start, stop = spans.pop(narrowest)
+        if stop - start > self.size * SCAN_FRACTION:
+            keep = np.ones(self.size, dtype=bool)
+            for name, (low, high) in ranges.items():
+                self._apply(keep, getattr(self, name), low, high)
+            return np.flatnonzero(keep)
+
+        rows = self._order[narrowest][start:stop]
+        for name in spans:
+            keep = np.ones(len(rows), dtype=bool)
+            self._apply(keep, getattr(self, name)[rows], *ranges[name])
+            rows = rows[keep]
+        return np.sort(rows)
+
+    @staticmethod
+    def _apply(keep, values, low, high):
+        """Clear keep where values fall outside low..high (NaN always does)"""
+        if low is not None:
+            keep &= values >= low
+        if high is not None:
+            keep &= values <= high
+
+    def limits(self, name):
+        """(lowest, highest) known value of a column, or None if no value is known"""
+        values = self._sorted[name]
+        known = np.searchsorted(values, np.inf, side='right')
+        return (float(values[0]), float(values[known - 1])) if known else None
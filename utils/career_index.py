@@ -0,0 +1,169 @@
+import numpy as np
+
+from utils.scoring_engine import (
+    RIASEC_TYPES, PRIMARY_SHARE, SECONDARY_SHARE, RIASEC_WEIGHT, SKILLS_WEIGHT, VALUES_WEIGHT,
+    get_compiled_catalog, round_scores, top_k_indices
+)
+
+# Careers per leaf
+LEAF_SIZE = 128
+
+# Catalogs smaller than this are always scanned in full. On synthetic
+# catalogs an approximate search first beats the full scan at about 20k
+# careers (1.2 vs 1.6-2.0 ms per match); at 5k-10k the two take the same time.
+INDEX_MIN_CATALOG_SIZE = 20000
+
+# Careers scored when searching approximately: at least SHORTLIST_FACTOR per
+# requested match and SHORTLIST_FRACTION of the catalog. Leaf bounds are loose,
+# so recall grows with the catalog share scored: on synthetic catalogs
+# recall@10 is about 0.5 at 5%, 0.75 at 10% and 0.91-0.96 at 25% (20k-100k
+# careers).
+SHORTLIST_FACTOR = 20
+SHORTLIST_FRACTION = 0.25
+
+# Slack on score bounds so float noise never prunes a tied career
+_EPSILON = 1e-6
+
+
+class CareerIndex:
+    """KD-tree partition of careers in RIASEC + skills space
+
+    Each career is embedded as its weighted RIASEC one-hots, skill weights
+    and value matches, so its match score is a dot product with the
+    profile's [riasec scores, skill confidences, value selection shares]
+    vector. Careers are grouped by (primary, secondary) type and each group
+    is split recursively at the median of its widest dimension into leaves.
+    Profile vectors are never negative, so a leaf's per-dimension maxima
+    bound the score of every career in it.
+    """
+
+    def __init__(self, catalog, leaf_size=LEAF_SIZE):
+        self.catalog = catalog
+        self.leaf_size = leaf_size
+
+        skill_weights = np.zeros_like(catalog.skill_matrix)
+        np.divide(catalog.skill_matrix, catalog.skill_counts[:, None], out=skill_weights, where=catalog.skill_counts[:, None] > 0)
+        features = np.hstack([
+            (catalog.primary * PRIMARY_SHARE + catalog.secondary * SECONDARY_SHARE) / 5 * RIASEC_WEIGHT,
+            skill_weights * SKILLS_WEIGHT,
+            catalog.value_matrix * VALUES_WEIGHT
+        ])
+        self.skill_columns = slice(len(RIASEC_TYPES), len(RIASEC_TYPES) + catalog.skill_width)
+        self.value_columns = slice(self.skill_columns.stop, features.shape[1])
+
+        # Careers stored leaf by leaf so each leaf is a contiguous block
+        leaves = self._build_leaves(features)
+        self.rows = np.concatenate(leaves) if leaves else np.empty(0, dtype=np.intp)
+        self.features = features[self.rows]
+        self.leaf_starts = np.cumsum([0] + [len(leaf) for leaf in leaves])
+
+        self.upper = np.array([features[leaf].max(axis=0) for leaf in leaves]).reshape(-1, features.shape[1])
+        self.skill_presence = self.upper[:, self.skill_columns] > 0
+
+    def _build_leaves(self, features):
+        """Split careers into leaves of at most leaf_size rows"""
+        primary = np.argmax(self.catalog.primary, axis=1) + self.catalog.primary.any(axis=1)
+        secondary = np.argmax(self.catalog.secondary, axis=1) + self.catalog.secondary.any(axis=1)
+        pairs = primary * (len(RIASEC_TYPES) + 1) + secondary
+
+        leaves = []
+        pending = [np.flatnonzero(pairs == pair) for pair in np.unique(pairs)][::-1]
+        while pending:
+            rows = pending.pop()
+            points = features[rows]
+            spread = points.max(axis=0) - points.min(axis=0)
+            if len(rows) <= self.leaf_size or not spread.any():
+                leaves.append(rows)
+                continue
+            order = np.argsort(points[:, np.argmax(spread)], kind='stable')
+            half = len(rows) // 2
+            pending.append(rows[order[half:]])
+            pending.append(rows[order[:half]])
+        return leaves
+
+    def query_vector(self, user_profile):
+        """Profile vector matching the career embedding"""
+        skills = np.zeros(self.catalog.skill_width)
+        if user_profile['skillsConfidence']:
+            skills = self.catalog.skills_vector(user_profile['skillsConfidence'])
+        values = np.zeros(self.catalog.value_width)
+        if user_profile['workValues']:
+            values = self.catalog.values_vector(user_profile['workValues']) / len(user_profile['workValues'])
+        return np.concatenate([self.catalog.riasec_vector(user_profile['riasecScores']), skills, values])
+
+    def leaf_bounds(self, query):
+        """Upper bound on the match score of any career in each leaf"""
+        skills = query[self.skill_columns]
+        values = query[self.value_columns]
+        riasec_bound = self.upper[:, :len(RIASEC_TYPES)] @ query[:len(RIASEC_TYPES)]
+        # Skills and values scores are averages, so also capped by their best single term
+        skills_bound = np.minimum(
+            self.upper[:, self.skill_columns] @ skills,
+            SKILLS_WEIGHT * (self.skill_presence * skills).max(axis=1, initial=0)
+        )
+        values_bound = np.minimum(self.upper[:, self.value_columns] @ values, VALUES_WEIGHT * values.sum())
+        return riasec_bound + skills_bound + values_bound + _EPSILON
+
+    def _leaf_positions(self, leaves):
+        """Positions in self.rows covered by the given leaves"""
+        if len(leaves) == 0:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate([np.arange(self.leaf_starts[leaf], self.leaf_starts[leaf + 1]) for leaf in leaves])
+
+    def search(self, user_profile, top_k=10, exact=True, shortlist=None):
+        """Top matches as (catalog rows, rounded scores, score components), best first
+
+        Leaves are visited best bound first until a shortlist of careers
+        (default the larger of SHORTLIST_FACTOR * top_k and SHORTLIST_FRACTION
+        of the catalog) has been scored against the embedding, and only those
+        that can still reach the shortlist's k-th score are rescored with the
+        full formula. With exact=False the best of the shortlist is returned.
+        With exact=True every other leaf whose bound still reaches that score
+        is scored too, which gives the same result as a full scan but is no
+        faster than one below about 100k careers, so the matcher only uses
+        approximate searches.
+        """
+        query = self.query_vector(user_profile)
+        bounds = self.leaf_bounds(query)
+        leaf_order = np.argsort(-bounds, kind='stable')
+
+        budget = shortlist or max(top_k * SHORTLIST_FACTOR, int(self.catalog.size * SHORTLIST_FRACTION), self.leaf_size)
+        sizes = np.diff(self.leaf_starts)[leaf_order]
+        visited = leaf_order[:np.searchsorted(np.cumsum(sizes), budget) + 1]
+        positions = self._leaf_positions(visited)
+        estimates = self.features[positions] @ query
+
+        # A career rounds up to the k-th score only from k-th score - 0.5
+        if len(positions) >= top_k:
+            kth_score = np.partition(round_scores(estimates), len(positions) - top_k)[len(positions) - top_k]
+        else:
+            kth_score = -np.inf
+        threshold = kth_score - 0.5 - _EPSILON
+
+        if exact and len(positions) < self.catalog.size:
+            remaining = leaf_order[len(visited):]
+            remaining = remaining[bounds[remaining] >= threshold]
+            extra = self._leaf_positions(remaining)
+            positions = np.concatenate([positions, extra])
+            estimates = np.concatenate([estimates, self.features[extra] @ query])
+        positions = positions[estimates >= threshold]
+
+        # Rescore candidates with the full formula, in catalog order so ties resolve as in a full scan
+        rows = np.sort(self.rows[positions])
+        components = self.catalog.score_components(user_profile, rows)
+        scores = round_scores(components[0] + components[1] + components[2])
+        best = top_k_indices(scores, top_k)
+        return rows[best], scores[best], components[:, best]
+
+
+_career_index = None
+
+
+def get_career_index():
+    """Return the index over the compiled catalog, building it on first use"""
+    global _career_index
+    catalog = get_compiled_catalog()
+
+    if _career_index is None or _career_index.catalog is not catalog:
+        _career_index = CareerIndex(catalog)
+    return _career_index
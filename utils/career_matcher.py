@@ -1,60 +1,116 @@
-def calculate_career_matches(user_profile):
-    """Calculate career matches based on user profile"""
-    from data.careers import careers
-    
-    matches = []
-    
-    for career in careers:
-        score = 0
-        
-        # RIASEC matching (40% weight)
-        primary_score = user_profile['riasecScores'].get(career['primary_type'], 0)
-        secondary_score = user_profile['riasecScores'].get(career.get('secondary_type', ''), 0)
-        riasec_score = (primary_score * 0.7 + secondary_score * 0.3) / 5 * 40
-        
-        # Skills matching (35% weight)
-        skills_match = 0
-        if user_profile['skillsConfidence']:
-            matched_skills = 0
-            for skill in career['required_skills']:
-                if skill in user_profile['skillsConfidence']:
-                    matched_skills += user_profile['skillsConfidence'][skill] / 5
-            skills_score = (matched_skills / len(career['required_skills'])) * 35 if career['required_skills'] else 0
+import numpy as np
+
+from utils.career_index import INDEX_MIN_CATALOG_SIZE, get_career_index
+from utils.career_store import CareerMatch
+from utils.match_cache import fit_cache, match_cache, profile_key, variant_key
+from utils.scoring_engine import (
+    DEFAULT_WEIGHTS, IncrementalScorer, combine_fits, get_compiled_catalog, round_scores, top_k_indices, top_k_rows
+)
+
+
+def calculate_career_matches(user_profile, top_k=10, exact=True, weights=None, filters=None):
+    """Calculate the top_k career matches based on user profile
+
+    Matches are found by a full scan. exact=False lets catalogs of
+    career_index.INDEX_MIN_CATALOG_SIZE careers or more be searched through
+    the career index instead, scoring only a shortlist (a quarter of the
+    catalog, see career_index.SHORTLIST_FRACTION): about 2x faster from 50k
+    careers, at the cost of 5-10% of the exact top 10.
+    Results are shared across sessions through the process-wide match cache.
+    weights (a ScoringWeights) replaces the default component weights; the
+    profile's unweighted fits are cached, so matching it again under other
+    weights only re-combines and re-ranks them. filters (keyword arguments
+    of CareerFacets.filter, e.g. {'min_salary': 80000}) limit the matches to
+    careers passing them.
+    """
+    catalog = get_compiled_catalog()
+    weights = weights or DEFAULT_WEIGHTS
+    filters = {name: value for name, value in (filters or {}).items() if value is not None}
+
+    # Fits depend on the profile alone; matches also on the options
+    fits_key = profile_key(user_profile, catalog.version)
+    key = variant_key(fits_key, top_k=top_k, exact=exact, weights=tuple(weights), filters=tuple(sorted(filters.items())))
+    cached = match_cache.get(key)
+    if cached is not None:
+        return cached
+
+    fits = fit_cache.get(fits_key)
+    if not exact and fits is None and not filters and weights == DEFAULT_WEIGHTS and catalog.size >= INDEX_MIN_CATALOG_SIZE:
+        # The index bounds are built for the default weights
+        rows, match_scores, components = get_career_index().search(user_profile, top_k, exact=False)
+    else:
+        if fits is None:
+            # Unweighted component fits for every career in one vectorized pass
+            fits = catalog.score_fits(user_profile)
+            fits.setflags(write=False)
+            fit_cache.put(fits_key, fits)
+        if filters:
+            # Rank only the passing rows; their indices map back to catalog rows
+            candidates = catalog.facets.filter(**filters)
+            components = combine_fits(fits[:, candidates], weights)
         else:
-            skills_score = 0
-        
-        # Work values matching (25% weight)
-        values_score = 0
-        if user_profile['workValues']:
-            value_keywords = {
-                'Work-Life Balance': ['flexible', 'balance', 'remote'],
-                'Job Security': ['stable', 'secure', 'established'],
-                'High Earnings': ['high salary', 'lucrative', 'well-paid'],
-                'Helping Others': ['help', 'serve', 'support', 'care'],
-                'Creativity': ['creative', 'innovative', 'design'],
-                'Leadership': ['lead', 'manage', 'direct'],
-                'Continuous Learning': ['learn', 'grow', 'develop'],
-                'Recognition': ['recognition', 'prestige', 'respected']
-            }
-            
-            matched_values = 0
-            for value in user_profile['workValues']:
-                keywords = value_keywords.get(value, [])
-                for keyword in keywords:
-                    if any(keyword in env.lower() for env in career.get('work_environment', [])):
-                        matched_values += 1
-                        break
-            
-            values_score = (matched_values / len(user_profile['workValues'])) * 25 if user_profile['workValues'] else 0
-        
-        total_score = riasec_score + skills_score + values_score
-        
-        matches.append({
-            **career,
-            'matchScore': round(total_score)
-        })
-    
-    # Sort by match score
-    matches.sort(key=lambda x: x['matchScore'], reverse=True)
-    
-    return matches[:10]  # Return top 10 matches
+            candidates = None
+            components = combine_fits(fits, weights)
+        scores = round_scores(components[0] + components[1] + components[2])
+        rows = top_k_indices(scores, top_k)
+        match_scores = scores[rows]
+        components = components[:, rows]
+        if candidates is not None:
+            rows = candidates[rows]
+
+    # Best matches first; ties keep catalog order
+    breakdowns = catalog.breakdown(user_profile, rows, components, weights)
+    matches = [
+        CareerMatch(catalog.careers, int(i), int(score), breakdown)
+        for i, score, breakdown in zip(rows, match_scores, breakdowns)
+    ]
+    match_cache.put(key, matches)
+    return matches
+
+
+def calculate_career_matches_batch(user_profiles, top_k=10, chunk_size=256, workers=None, weights=None):
+    """Top career matches for many profiles at once
+
+    Returns (indices, scores): profiles x top_k arrays of catalog rows and
+    match scores. Profiles are scored chunk_size at a time so memory stays
+    bounded by chunk_size x catalog size. With workers set, scoring is
+    spread over that many processes (see utils.parallel_scoring.ScoringPool,
+    which can also be kept open across calls).
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    if workers:
+        from utils.parallel_scoring import ScoringPool
+        with ScoringPool(workers) as pool:
+            return pool.match_batch(user_profiles, top_k, chunk_size, weights)
+
+    catalog = get_compiled_catalog()
+    k = min(top_k, catalog.size)
+
+    indices = np.empty((len(user_profiles), k), dtype=np.intp)
+    scores = np.empty((len(user_profiles), k), dtype=int)
+
+    for start in range(0, len(user_profiles), chunk_size):
+        chunk = user_profiles[start:start + chunk_size]
+        match_scores = round_scores(catalog.score_batch(chunk, weights))
+        top = top_k_rows(match_scores, k)
+        indices[start:start + len(chunk)] = top
+        scores[start:start + len(chunk)] = np.take_along_axis(match_scores, top, axis=1)
+
+    return indices, scores
+
+
+def create_what_if_scorer(user_profile, weights=None):
+    """Incremental scorer for exploring changes to a profile"""
+    return IncrementalScorer(get_compiled_catalog(), user_profile, weights or DEFAULT_WEIGHTS)
+
+
+def rank_what_if(scorer, top_k=10):
+    """Top matches for the scorer's current inputs, in calculate_career_matches format"""
+    components = scorer.score_components()
+    match_scores = round_scores(components[0] + components[1] + components[2])
+    rows = top_k_indices(match_scores, top_k)
+    breakdowns = scorer.catalog.breakdown(scorer.profile(), rows, components[:, rows], scorer.weights)
+    return [
+        CareerMatch(scorer.catalog.careers, int(i), int(match_scores[i]), breakdown)
+        for i, breakdown in zip(rows, breakdowns)
+    ]
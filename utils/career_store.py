@@ -0,0 +1,285 @@
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from utils.interning import skill_registry
+
+
+class StringColumn(Sequence):
+    """Strings packed into one UTF-8 buffer with offsets"""
+
+    __slots__ = ('data', 'offsets')
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, strings):
+        encoded = [string.encode('utf-8') for string in strings]
+        offsets = np.cumsum([0] + [len(item) for item in encoded], dtype=np.int64)
+        return cls(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets)
+
+    def to_arrays(self, prefix):
+        return {f'{prefix}.data': self.data, f'{prefix}.offsets': self.offsets}
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix):
+        return cls(arrays[f'{prefix}.data'], arrays[f'{prefix}.offsets'])
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class CategoricalColumn(Sequence):
+    """Repeated strings stored once in a table and referenced by code (-1 for missing)"""
+
+    __slots__ = ('codes', 'table')
+
+    def __init__(self, codes, table):
+        self.codes = codes
+        self.table = table
+
+    @classmethod
+    def from_strings(cls, strings):
+        lookup = {}
+        codes = np.fromiter(
+            (-1 if string is None else lookup.setdefault(string, len(lookup)) for string in strings),
+            dtype=np.int32
+        )
+        return cls(codes, StringColumn.from_strings(lookup))
+
+    def to_arrays(self, prefix):
+        return {f'{prefix}.codes': self.codes, **self.table.to_arrays(f'{prefix}.table')}
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix):
+        return cls(arrays[f'{prefix}.codes'], StringColumn.from_arrays(arrays, f'{prefix}.table'))
+
+    def __getitem__(self, i):
+        code = self.codes[i]
+        return None if code < 0 else self.table[code]
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class ListColumn(Sequence):
+    """Per-row lists of table codes stored as one flat array with offsets"""
+
+    __slots__ = ('offsets', 'codes', 'table')
+
+    def __init__(self, offsets, codes, table):
+        self.offsets = offsets
+        self.codes = codes
+        self.table = table
+
+    @classmethod
+    def from_lists(cls, lists):
+        lookup = {}
+        codes = [[lookup.setdefault(item, len(lookup)) for item in items] for items in lists]
+        offsets = np.cumsum([0] + [len(row) for row in codes], dtype=np.int64)
+        flat = np.fromiter((code for row in codes for code in row), dtype=np.int32, count=offsets[-1])
+        return cls(offsets, flat, StringColumn.from_strings(lookup))
+
+    def to_arrays(self, prefix):
+        return {f'{prefix}.offsets': self.offsets, f'{prefix}.codes': self.codes, **self.table.to_arrays(f'{prefix}.table')}
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix):
+        return cls(arrays[f'{prefix}.offsets'], arrays[f'{prefix}.codes'], StringColumn.from_arrays(arrays, f'{prefix}.table'))
+
+    def row_codes(self, i):
+        return self.codes[self.offsets[i]:self.offsets[i + 1]]
+
+    def __getitem__(self, i):
+        return [self.table[code] for code in self.row_codes(i)]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+class CareerStore(Sequence):
+    """Career catalog held as columns; indexing returns Career views"""
+
+    STRING_COLUMNS = ('ids', 'titles', 'descriptions')
+    CATEGORICAL_COLUMNS = ('primary_types', 'secondary_types', 'salary_ranges', 'growth_outlooks', 'educations')
+
+    def __init__(self, ids, titles, descriptions, primary_types, secondary_types,
+                 skill_offsets, skill_ids, work_environments, salary_ranges, growth_outlooks, educations):
+        self.ids = ids
+        self.titles = titles
+        self.descriptions = descriptions
+        self.primary_types = primary_types
+        self.secondary_types = secondary_types
+        # Required skills as skill registry IDs
+        self.skill_offsets = skill_offsets
+        self.skill_ids = skill_ids
+        self.work_environments = work_environments
+        self.salary_ranges = salary_ranges
+        self.growth_outlooks = growth_outlooks
+        self.educations = educations
+
+    @classmethod
+    def from_records(cls, careers):
+        """Build a store from career dicts in the data.careers format"""
+        skill_ids = [skill_registry.encode(career['required_skills']) for career in careers]
+        return cls(
+            ids=StringColumn.from_strings(career['id'] for career in careers),
+            titles=StringColumn.from_strings(career['title'] for career in careers),
+            descriptions=StringColumn.from_strings(career.get('description', '') for career in careers),
+            primary_types=CategoricalColumn.from_strings(career['primary_type'] for career in careers),
+            secondary_types=CategoricalColumn.from_strings(career.get('secondary_type') for career in careers),
+            skill_offsets=np.cumsum([0] + [len(ids) for ids in skill_ids], dtype=np.int64),
+            skill_ids=np.concatenate(skill_ids) if careers else np.empty(0, dtype=np.int32),
+            work_environments=ListColumn.from_lists(career.get('work_environment', []) for career in careers),
+            salary_ranges=CategoricalColumn.from_strings(career.get('salary_range') for career in careers),
+            growth_outlooks=CategoricalColumn.from_strings(career.get('growth_outlook') for career in careers),
+            educations=CategoricalColumn.from_strings(career.get('education') for career in careers)
+        )
+
+    def to_arrays(self):
+        """Every column as a flat name -> array dict
+
+        Skill registry IDs differ between processes, so required skills are
+        saved as codes into their own name table.
+        """
+        arrays = {}
+        for name in self.STRING_COLUMNS:
+            arrays.update(getattr(self, name).to_arrays(name))
+        for name in self.CATEGORICAL_COLUMNS:
+            arrays.update(getattr(self, name).to_arrays(name))
+        arrays.update(self.work_environments.to_arrays('work_environments'))
+        skill_table, skill_codes = np.unique(self.skill_ids, return_inverse=True)
+        arrays['skill_offsets'] = self.skill_offsets
+        arrays['skill_codes'] = skill_codes.astype(np.int32)
+        arrays.update(StringColumn.from_strings(skill_registry.name(id_) for id_ in skill_table).to_arrays('skill_names'))
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Rebuild a store from to_arrays() output (arrays may be memory-mapped)"""
+        skill_names = StringColumn.from_arrays(arrays, 'skill_names')
+        skill_table = skill_registry.encode(skill_names)
+        skill_codes = arrays['skill_codes']
+        if np.array_equal(skill_table, np.arange(len(skill_table))):
+            # Codes already are this process's registry IDs; keep the mapped array
+            skill_ids = skill_codes
+        else:
+            skill_ids = skill_table[skill_codes]
+        return cls(
+            skill_offsets=arrays['skill_offsets'],
+            skill_ids=skill_ids,
+            work_environments=ListColumn.from_arrays(arrays, 'work_environments'),
+            **{name: StringColumn.from_arrays(arrays, name) for name in cls.STRING_COLUMNS},
+            **{name: CategoricalColumn.from_arrays(arrays, name) for name in cls.CATEGORICAL_COLUMNS}
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, row):
+        row = int(row)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError('career index out of range')
+        return Career(self, row)
+
+    def __iter__(self):
+        return (Career(self, row) for row in range(len(self)))
+
+    def required_skills(self, row):
+        return [skill_registry.name(id_) for id_ in self.skill_ids[self.skill_offsets[row]:self.skill_offsets[row + 1]]]
+
+    def field(self, key, row):
+        """Value of one career field; KeyError if the career has no such field"""
+        if key == 'id':
+            return self.ids[row]
+        if key == 'title':
+            return self.titles[row]
+        if key == 'description':
+            return self.descriptions[row]
+        if key == 'required_skills':
+            return self.required_skills(row)
+        if key == 'work_environment':
+            return self.work_environments[row]
+        column = {
+            'primary_type': self.primary_types,
+            'secondary_type': self.secondary_types,
+            'salary_range': self.salary_ranges,
+            'growth_outlook': self.growth_outlooks,
+            'education': self.educations
+        }.get(key)
+        value = column[row] if column is not None else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+
+class Career(Mapping):
+    """Read-only view of one career in a CareerStore
+
+    Behaves like the career dicts in data.careers (career['title'],
+    career.get('secondary_type', '')) without copying any field.
+    """
+
+    __slots__ = ('store', 'row')
+
+    FIELDS = ('id', 'title', 'description', 'primary_type', 'secondary_type', 'required_skills',
+              'work_environment', 'salary_range', 'growth_outlook', 'education')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key):
+        return self.store.field(key, self.row)
+
+    def __iter__(self):
+        return (key for key in self.FIELDS if key in self)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        try:
+            self.store.field(key, self.row)
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class CareerMatch(Career):
+    """Career view carrying its match score (and score breakdown) for one profile"""
+
+    __slots__ = ('match_score', 'breakdown')
+
+    def __init__(self, store, row, match_score, breakdown=None):
+        super().__init__(store, row)
+        self.match_score = match_score
+        self.breakdown = breakdown
+
+    def __getitem__(self, key):
+        if key == 'matchScore':
+            return self.match_score
+        if key == 'scoreBreakdown' and self.breakdown is not None:
+            return self.breakdown
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        yield from super().__iter__()
+        yield 'matchScore'
+        if self.breakdown is not None:
+            yield 'scoreBreakdown'
+
+    def __contains__(self, key):
+        if key == 'matchScore' or (key == 'scoreBreakdown' and self.breakdown is not None):
+            return True
+        return super().__contains__(key)
@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+import os
+
+from data.careers import careers
+from utils.catalog_loader import DEFAULT_CATALOG_PATH, iter_json_records, load_catalog, normalize_career
+from utils.file_store import atomic_write
+from utils.scoring_engine import RIASEC_TYPES
+
+# Rejected records listed in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Records between progress callbacks
+PROGRESS_INTERVAL = 500
+
+
+def writable_catalog_path():
+    """Catalog file that imports and new careers are saved to"""
+    path = os.getenv('CAREER_CATALOG_PATH') or DEFAULT_CATALOG_PATH
+    if not path.lower().endswith('.jsonl'):
+        raise ValueError(f"CAREER_CATALOG_PATH {path} is not a .jsonl file, so it can't be updated")
+    return path
+
+
+def iter_uploaded_records(uploaded_file):
+    """Raw records from an uploaded CSV, JSON or JSON Lines file, read incrementally"""
+    text = io.TextIOWrapper(uploaded_file, encoding='utf-8', newline='')
+    try:
+        if uploaded_file.name.lower().endswith('.csv'):
+            yield from csv.DictReader(text)
+        else:
+            yield from iter_json_records(text)
+    finally:
+        # Leave the upload itself open for Streamlit
+        text.detach()
+
+
+def new_report():
+    return {'accepted': 0, 'rejected': 0, 'errors': []}
+
+
+def validated(records, normalize, report, progress=None):
+    """Records that pass normalize; failures are counted in report"""
+    for number, record in enumerate(records, 1):
+        try:
+            item = normalize(record)
+        except ValueError as e:
+            report['rejected'] += 1
+            if len(report['errors']) < MAX_REPORTED_ERRORS:
+                report['errors'].append(f"Record {number}: {e}")
+        else:
+            report['accepted'] += 1
+            yield item
+        if progress and number % PROGRESS_INTERVAL == 0:
+            progress(report)
+
+
+def import_careers(records, path, progress=None):
+    """Validate career records and add them to the JSON Lines catalog at path
+
+    Records are streamed into a copy of the catalog that replaces it once
+    complete, so readers see either the old or the new catalog. Careers
+    whose id is already in the catalog are updated. The new catalog's
+    column cache is built before returning, so matching only maps it.
+    Returns a report of accepted and rejected records.
+    """
+    report = new_report()
+    with atomic_write(path, prefix='.importing-', suffix='.jsonl') as out:
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as current:
+                for line in current:
+                    out.write(line if line.endswith('\n') else line + '\n')
+        else:
+            # A new catalog starts from the built-in careers
+            for career in careers:
+                out.write(json.dumps(career) + '\n')
+        for career in validated(records, normalize_career, report, progress):
+            out.write(json.dumps(career) + '\n')
+    load_catalog(path)
+    return report
+
+
+def add_career(career, path):
+    """Append one normalized career to the JSON Lines catalog at path
+
+    Unlike import_careers the catalog is not copied; the record is written
+    with a single append, and a career with an existing id is updated.
+    """
+    if not os.path.exists(path):
+        import_careers([career], path)
+        return
+    line = json.dumps(career) + '\n'
+    with open(path, 'rb+') as f:
+        # A hand-edited catalog may lack the final newline
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                line = '\n' + line
+        f.write(line.encode('utf-8'))
+    load_catalog(path)
+
+
+def normalize_question(record):
+    """RIASEC question dict from an uploaded record"""
+    if not isinstance(record, dict):
+        raise ValueError("question is not an object")
+    question = {}
+    for field in ('id', 'text', 'type'):
+        value = record.get(field)
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"question is missing {field}")
+        question[field] = value.strip()
+    question['type'] = question['type'].lower()
+    if question['type'] not in RIASEC_TYPES:
+        raise ValueError(f"type {question['type']!r} is not a RIASEC type")
+
+    # Reverse-keyed questions score agreement as disagreement; CSV uploads give it as text
+    reverse = record.get('reverse', False)
+    if isinstance(reverse, str):
+        reverse = reverse.strip().lower()
+        if reverse not in ('', 'true', 'false', 'yes', 'no', '1', '0'):
+            raise ValueError(f"reverse {record['reverse']!r} is not true or false")
+        reverse = reverse in ('true', 'yes', '1')
+    if reverse:
+        question['reverse'] = True
+    return question
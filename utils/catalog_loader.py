@@ -0,0 +1,241 @@
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from utils.career_store import CareerStore
+from utils.scoring_engine import RIASEC_TYPES, CompiledCatalog
+
+# Bump when the cached column layout changes so old caches are rebuilt
+CACHE_FORMAT = 2
+
+# Subdirectory of a cache holding the catalog's compiled scoring matrices
+COMPILED_DIR = 'compiled'
+
+# Fields holding lists; CSV cells separate their items with LIST_SEPARATOR
+LIST_FIELDS = ('required_skills', 'work_environment')
+LIST_SEPARATOR = ';'
+
+REQUIRED_FIELDS = ('id', 'title', 'primary_type')
+
+# Catalog written by the admin panel; used when CAREER_CATALOG_PATH is not set
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'career_catalog.jsonl')
+
+# Largest single JSON record the streaming reader will buffer
+MAX_RECORD_SIZE = 1 << 24
+
+# Store and compiled matrices opened in this process for each catalog path, with the
+# (size, mtime) they were opened at; a changed file replaces its entry rather than adding one
+_loaded = {}
+
+
+def file_digest(path):
+    """Hex digest of a file's contents"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def catalog_path():
+    """Career catalog file in use, or None to use data.careers
+
+    A catalog file that does not exist yet (nothing imported) is skipped.
+    """
+    path = os.getenv('CAREER_CATALOG_PATH') or DEFAULT_CATALOG_PATH
+    return path if os.path.exists(path) else None
+
+
+def iter_json_records(stream, chunk_size=1 << 16):
+    """Objects from a JSON array or JSON Lines text stream, decoded incrementally
+
+    Only the current chunk and the record being decoded are held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    opened = False
+    while True:
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer):
+            if not opened:
+                opened = True
+                if buffer[position] == '[':
+                    position += 1
+                    continue
+            if buffer[position] == ']':
+                return
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Usually a record cut off by the chunk boundary
+                if eof:
+                    raise
+                if len(buffer) - position > MAX_RECORD_SIZE:
+                    raise ValueError(f"JSON record larger than {MAX_RECORD_SIZE} characters") from None
+            else:
+                yield record
+                position = end
+                continue
+        elif eof:
+            return
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def normalize_career(record):
+    """Career dict in the data.careers format from a raw CSV row or JSON object"""
+    if not isinstance(record, dict):
+        raise ValueError("career is not an object")
+    career = {}
+    for key, value in record.items():
+        if key is None or value is None:
+            continue
+        key = key.strip()
+        if key in LIST_FIELDS:
+            if isinstance(value, str):
+                value = value.split(LIST_SEPARATOR)
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise ValueError(f"{key} is not a list of strings")
+            value = [item.strip() for item in value if item.strip()]
+        elif isinstance(value, str):
+            value = value.strip()
+            if key in ('primary_type', 'secondary_type'):
+                value = value.lower()
+            if not value and key not in REQUIRED_FIELDS:
+                continue
+        career[key] = value
+
+    missing = [field for field in REQUIRED_FIELDS if not career.get(field)]
+    if missing:
+        raise ValueError(f"career is missing {', '.join(missing)}")
+    for field in ('primary_type', 'secondary_type'):
+        if field in career and career[field] not in RIASEC_TYPES:
+            raise ValueError(f"{field} {career[field]!r} is not a RIASEC type")
+    career.setdefault('required_skills', [])
+    career.setdefault('work_environment', [])
+    return career
+
+
+def read_careers(path):
+    """Career dicts from a CSV, JSON or JSON Lines file
+
+    A career listed more than once keeps its first position and its last
+    contents, so appended records update earlier ones.
+    """
+    careers = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        records = csv.DictReader(f) if path.lower().endswith('.csv') else iter_json_records(f)
+        for number, record in enumerate(records, 1):
+            try:
+                career = normalize_career(record)
+            except ValueError as e:
+                raise ValueError(f"{path}: record {number}: {e}") from None
+            careers[career['id']] = career
+    return list(careers.values())
+
+
+def default_cache_dir(path):
+    return os.getenv('CAREER_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(path)), '.career_cache')
+
+
+def save_arrays(arrays, directory):
+    """Save each array as directory/<name>.npy"""
+    os.makedirs(directory, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f'{name}.npy'), np.ascontiguousarray(array))
+
+
+def write_cache(store, cache_path):
+    """Save every store column, and the scoring matrices compiled from them, as .npy files under cache_path"""
+    parent = os.path.dirname(cache_path)
+    os.makedirs(parent, exist_ok=True)
+    # Written to a scratch directory and renamed so readers never see a partial cache
+    scratch = tempfile.mkdtemp(dir=parent, prefix='.building-')
+    try:
+        save_arrays(store.to_arrays(), scratch)
+        save_arrays(CompiledCatalog(store).to_arrays(), os.path.join(scratch, COMPILED_DIR))
+        try:
+            os.rename(scratch, cache_path)
+        except OSError:
+            # Another process finished the same cache first
+            if not os.path.isdir(cache_path):
+                raise
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def cache_name(path, digest):
+    """Cache directory name for one revision of the catalog at path"""
+    return f'{os.path.basename(path)}-{digest}-v{CACHE_FORMAT}'
+
+
+def prune_cache(cache_dir, path, keep):
+    """Remove cached revisions of the catalog at path other than keep
+
+    Caches of other catalogs sharing cache_dir are left alone; caches named
+    by digest only, which no longer say which catalog they belong to, are
+    removed too. Stores still mapping a removed cache keep their pages.
+    """
+    stem = os.path.basename(path)
+    for name in os.listdir(cache_dir):
+        entry = os.path.join(cache_dir, name)
+        if entry == keep or name.startswith('.') or not os.path.isdir(entry):
+            continue
+        parts = name.rsplit('-', 2)
+        if (len(parts) == 3 and parts[0] == stem) or (len(parts) == 2 and len(parts[0]) == 32):
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def load_arrays(directory):
+    """Memory-map every .npy file in directory as a name -> array dict"""
+    arrays = {}
+    for filename in os.listdir(directory):
+        if filename.endswith('.npy'):
+            arrays[filename[:-len('.npy')]] = np.load(os.path.join(directory, filename), mmap_mode='r')
+    return arrays
+
+
+def read_cache(cache_path):
+    """Memory-map a cache written by write_cache as (store, compiled matrix arrays)"""
+    return CareerStore.from_arrays(load_arrays(cache_path)), load_arrays(os.path.join(cache_path, COMPILED_DIR))
+
+
+def load_catalog(path, cache_dir=None):
+    """CareerStore for a CSV, JSON or JSON Lines career file
+
+    The first load parses the file and writes its columns, and the scoring
+    matrices compiled from them, to a cache keyed by the file's hash; later
+    loads memory-map that cache, so processes loading the same file share
+    its pages. Writing a new revision removes the caches of older ones.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == stamp:
+        return loaded[1]
+
+    cache_dir = cache_dir or default_cache_dir(path)
+    cache_path = os.path.join(cache_dir, cache_name(path, file_digest(path)))
+    if not os.path.isdir(cache_path):
+        write_cache(CareerStore.from_records(read_careers(path)), cache_path)
+        prune_cache(cache_dir, path, cache_path)
+    store, matrices = read_cache(cache_path)
+    _loaded[path] = (stamp, store, matrices)
+    return store
+
+
+def load_compiled_catalog(path, version=0):
+    """CompiledCatalog over load_catalog(path), using the cached scoring matrices"""
+    store = load_catalog(path)
+    return CompiledCatalog.from_arrays(store, _loaded[os.path.abspath(path)][2], version, source=store)
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+
+def file_stamp(path):
+    """(path, size, mtime) of a file, with None for both if it doesn't exist
+
+    The stamp changes whenever the file is replaced or edited, so it tells
+    when a parsed copy needs re-reading without reading the file.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (path, None, None)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+@contextmanager
+def atomic_write(path, prefix, suffix, encoding='utf-8'):
+    """Text file opened for writing that replaces path once the block completes
+
+    It is written to a scratch file in path's directory and renamed over
+    path, so readers see either the old or the new file. The scratch file
+    is removed if the block raises.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, scratch = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=suffix)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            yield f
+        os.replace(scratch, path)
+    except BaseException:
+        os.remove(scratch)
+        raise
+
+
+class ReloadingFile:
+    """Value parsed from a file, re-read only when the file's stamp changes
+
+    path is a function returning the file to read, so environment
+    overrides apply; load(path) parses it, and default is the value while
+    the file doesn't exist. The same value is returned until the file
+    changes. lock serializes reloads; writers hold it across their
+    read-modify-write.
+    """
+
+    def __init__(self, path, load, default):
+        self.path = path
+        self.load = load
+        self.default = default
+        self.lock = threading.RLock()
+        self._stamp = None
+        self._value = default
+
+    def get(self):
+        path = self.path()
+        stamp = file_stamp(path)
+        with self.lock:
+            if self._stamp != stamp:
+                self._value = self.default if stamp[1] is None else self.load(path)
+                self._stamp = stamp
+            return self._value
@@ -0,0 +1,96 @@
+import itertools
+import threading
+from collections.abc import Mapping
+
+import numpy as np
+
+from data.skills_list import skills_categories
+from data.work_values import work_values
+
+
+class Registry:
+    """Stable integer IDs for names, assigned in first-seen order"""
+
+    def __init__(self, names=()):
+        self._ids = {}
+        self._names = []
+        self._lock = threading.Lock()
+        for name in names:
+            self.intern(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def intern(self, name):
+        """ID of name, assigning the next free ID if it is new"""
+        id_ = self._ids.get(name)
+        if id_ is None:
+            with self._lock:
+                id_ = self._ids.setdefault(name, len(self._names))
+                if id_ == len(self._names):
+                    self._names.append(name)
+        return id_
+
+    def id(self, name):
+        """ID of name, or None if it was never interned"""
+        return self._ids.get(name)
+
+    def name(self, id_):
+        return self._names[id_]
+
+    def encode(self, names):
+        """IDs of names as an int32 array, interning new ones"""
+        return np.fromiter((self.intern(name) for name in names), dtype=np.int32)
+
+    def lookup(self, names):
+        """IDs of names as an int32 array, -1 for names never interned"""
+        return np.fromiter(map(self._ids.get, names, itertools.repeat(-1)), dtype=np.int32)
+
+
+# IDs of assessed skills and work values follow the data modules' order,
+# so they are the same in every process; catalog-only skills come after
+skill_registry = Registry(skill for category in skills_categories for skill in category['skills'])
+value_registry = Registry(value['name'] for value in work_values)
+
+
+class SkillLevels(Mapping):
+    """Compact skill -> confidence mapping stored as registry IDs and levels
+
+    Reads like the skillsConfidence dict it replaces; names are only
+    looked up when the mapping is iterated or indexed by name.
+    """
+
+    __slots__ = ('ids', 'levels')
+
+    def __init__(self, ids, levels):
+        self.ids = np.asarray(ids, dtype=np.int32)
+        self.levels = np.asarray(levels, dtype=np.uint8)
+
+    @classmethod
+    def from_dict(cls, skills_confidence):
+        if isinstance(skills_confidence, cls):
+            return skills_confidence
+        return cls(skill_registry.encode(skills_confidence), list(skills_confidence.values()))
+
+    def __getitem__(self, skill):
+        id_ = skill_registry.id(skill)
+        match = np.flatnonzero(self.ids == id_) if id_ is not None else ()
+        if len(match) == 0:
+            raise KeyError(skill)
+        return int(self.levels[match[0]])
+
+    def __iter__(self):
+        return (skill_registry.name(id_) for id_ in self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __repr__(self):
+        return f"SkillLevels({dict(self)!r})"
+
+
+def encode_skill_levels(skills_confidence):
+    """(ids, levels) arrays for a skillsConfidence mapping"""
+    if isinstance(skills_confidence, SkillLevels):
+        return skills_confidence.ids, skills_confidence.levels
+    return skill_registry.lookup(skills_confidence), np.fromiter(skills_confidence.values(), dtype=float, count=len(skills_confidence))
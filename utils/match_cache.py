@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded, thread-safe LRU cache shared by all sessions in the process"""
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+class MatchCache(LRUCache):
+    """LRU cache of career match results"""
+
+    def get(self, key):
+        """Cached matches for key, or None"""
+        matches = super().get(key)
+        # Matches are read-only career views, so sessions can share them
+        return None if matches is None else list(matches)
+
+    def put(self, key, matches):
+        super().put(key, tuple(matches))
+
+
+def profile_key(user_profile, catalog_version, **options):
+    """Canonical hash of the scoring inputs of a profile"""
+    canonical = json.dumps({
+        'riasec': sorted(user_profile['riasecScores'].items()),
+        'skills': sorted(user_profile['skillsConfidence'].items()),
+        'values': sorted(user_profile['workValues']),
+        'catalog': catalog_version,
+        'options': sorted(options.items())
+    }, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def variant_key(key, **options):
+    """Key for options applied to what key identifies, without hashing the profile again
+
+    Option values must be hashable.
+    """
+    return (key, *sorted(options.items()))
+
+
+# Shared by every session served by this process
+match_cache = MatchCache(int(os.getenv('MATCH_CACHE_SIZE', '1024')))
+
+# Unweighted component fits (4 x catalog size floats each) of recently matched
+# profiles, so new scoring weights only re-combine and re-rank them
+fit_cache = LRUCache(int(os.getenv('FIT_CACHE_SIZE', '16')))
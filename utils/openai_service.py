@@ -1,14 +1,12 @@
 import os
 import json
+import importlib.util
 from typing import Dict, List, Tuple, Optional
 import streamlit as st
 
-# Import OpenAI at module level
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# The SDK itself is imported with the first client, so importing this module stays cheap
+OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
+if not OPENAI_AVAILABLE:
     st.warning("OpenAI library not installed. Using fallback responses.")
 
 class OpenAIService:
@@ -26,6 +24,7 @@ class OpenAIService:
         """Lazy load OpenAI client"""
         if self._client is None and self.api_key and OPENAI_AVAILABLE:
             try:
+                import openai
                 self._client = openai.OpenAI(api_key=self.api_key)
             except Exception as e:
                 st.warning(f"Error initializing OpenAI client: {str(e)}")
@@ -0,0 +1,27 @@
+import importlib
+
+# current_step -> (module, function) of the page that renders it.
+# Modules are imported on first use, so a session only loads the pages it visits.
+PAGES = {
+    'persona': ('pages.persona_selection', 'show_persona_selection'),
+    'welcome': ('pages.welcome', 'show_welcome'),
+    'riasec': ('pages.riasec_assessment', 'show_riasec_assessment'),
+    'skills': ('pages.skills_assessment', 'show_skills_assessment'),
+    'values': ('pages.values_assessment', 'show_values_assessment'),
+    'results': ('pages.results', 'show_results'),
+    'coaching': ('pages.coaching_dashboard', 'show_coaching_dashboard'),
+    'manager': ('pages.manager_dashboard', 'show_manager_dashboard'),
+    'admin': ('pages.admin_panel', 'show_admin_panel')
+}
+
+
+def load_page(step):
+    """Render function for step, importing its page module if needed"""
+    module, function = PAGES[step]
+    return getattr(importlib.import_module(module), function)
+
+
+def show_page(step):
+    """Render the page for step; unknown steps render nothing"""
+    if step in PAGES:
+        load_page(step)()
@@ -0,0 +1,181 @@
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from utils.interning import skill_registry, value_registry
+from utils.scoring_engine import DEFAULT_WEIGHTS, CompiledCatalog, get_compiled_catalog, round_scores, top_k_rows
+
+# Smallest catalog slice worth giving a worker of its own
+MIN_SHARD_ROWS = 2048
+
+# BLAS pools are pinned to one thread per worker; the process pool supplies the parallelism
+_BLAS_THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+
+
+class SharedCatalog:
+    """Scoring matrices of a CompiledCatalog placed in shared memory
+
+    Workers attach to the blocks by name, so the catalog is never pickled.
+    Encoding and scoring reuse CompiledCatalog's methods, which only need
+    these matrices and the registry widths.
+    """
+
+    ARRAYS = ('primary', 'secondary', 'skill_matrix', 'skill_counts', 'value_matrix')
+
+    riasec_vector = CompiledCatalog.riasec_vector
+    skills_vector = CompiledCatalog.skills_vector
+    value_ids = CompiledCatalog.value_ids
+    values_vector = CompiledCatalog.values_vector
+    encode_batch = CompiledCatalog.encode_batch
+    score_batch = CompiledCatalog.score_batch
+    score_encoded = CompiledCatalog.score_encoded
+
+    def __init__(self, arrays, skill_width, value_width, blocks=()):
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self.size = len(self.primary)
+        self.skill_width = skill_width
+        self.value_width = value_width
+        self.blocks = list(blocks)
+
+    @classmethod
+    def create(cls, catalog):
+        """Copy a compiled catalog's matrices into new shared memory blocks"""
+        arrays, blocks = {}, []
+        for name in cls.ARRAYS:
+            source = getattr(catalog, name)
+            block = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+            blocks.append(block)
+            arrays[name] = np.ndarray(source.shape, dtype=source.dtype, buffer=block.buf)
+            arrays[name][...] = source
+        return cls(arrays, catalog.skill_width, catalog.value_width, blocks)
+
+    @classmethod
+    def attach(cls, spec):
+        """Map the blocks described by spec() in another process"""
+        arrays, blocks = {}, []
+        for name, (block_name, shape, dtype) in spec['arrays'].items():
+            # Pool workers share the parent's resource tracker, which unlinks
+            # the blocks only if the parent never does
+            block = shared_memory.SharedMemory(name=block_name)
+            blocks.append(block)
+            arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+        # Registry IDs must mean the same skills and values as in the creating process
+        for registry, names in ((skill_registry, spec['skill_names']), (value_registry, spec['value_names'])):
+            if any(registry.intern(name) != id_ for id_, name in enumerate(names)):
+                raise RuntimeError("registry IDs differ from the scoring pool's parent process")
+        return cls(arrays, spec['skill_width'], spec['value_width'], blocks)
+
+    def spec(self):
+        """Picklable description of the blocks for attach()"""
+        return {
+            'arrays': {
+                name: (block.name, getattr(self, name).shape, getattr(self, name).dtype.str)
+                for name, block in zip(self.ARRAYS, self.blocks)
+            },
+            'skill_width': self.skill_width,
+            'value_width': self.value_width,
+            'skill_names': [skill_registry.name(id_) for id_ in range(self.skill_width)],
+            'value_names': [value_registry.name(id_) for id_ in range(self.value_width)]
+        }
+
+    def rows(self, start, stop):
+        """View of catalog rows start:stop sharing the same memory"""
+        arrays = {name: getattr(self, name)[start:stop] for name in self.ARRAYS}
+        return SharedCatalog(arrays, self.skill_width, self.value_width)
+
+    def close(self, unlink=False):
+        for name in self.ARRAYS:
+            setattr(self, name, None)
+        for block in self.blocks:
+            block.close()
+            if unlink:
+                block.unlink()
+        self.blocks = []
+
+
+_worker_catalog = None
+
+
+def _init_worker(spec):
+    global _worker_catalog
+    _worker_catalog = SharedCatalog.attach(spec)
+
+
+def _match_shard(task):
+    """Top matches of a profile chunk within one slice of catalog rows"""
+    user_profiles, start, stop, top_k, weights = task
+    shard = _worker_catalog.rows(start, stop)
+    match_scores = round_scores(shard.score_batch(user_profiles, weights))
+    top = top_k_rows(match_scores, top_k)
+    return top + start, np.take_along_axis(match_scores, top, axis=1)
+
+
+class ScoringPool:
+    """Worker processes scoring profiles against a shared-memory copy of the catalog
+
+    Profiles are split into chunks and, when there are fewer chunks than
+    workers, the catalog is split into row shards as well; partial top-k
+    lists are merged in the parent. Keep a pool open to score many cohorts
+    without paying for worker start-up each time.
+    """
+
+    def __init__(self, workers=None, catalog=None):
+        self.catalog = catalog or get_compiled_catalog()
+        self.workers = workers or os.cpu_count() or 1
+        self.shared = SharedCatalog.create(self.catalog)
+
+        saved = {var: os.environ.get(var) for var in _BLAS_THREAD_VARS}
+        os.environ.update({var: '1' for var in _BLAS_THREAD_VARS})
+        try:
+            # Spawned, not forked: Streamlit's server threads make fork unsafe
+            context = multiprocessing.get_context('spawn')
+            self.pool = context.Pool(self.workers, initializer=_init_worker, initargs=(self.shared.spec(),))
+        except BaseException:
+            self.shared.close(unlink=True)
+            raise
+        finally:
+            for var, value in saved.items():
+                if value is None:
+                    os.environ.pop(var, None)
+                else:
+                    os.environ[var] = value
+
+    def match_batch(self, user_profiles, top_k=10, chunk_size=256, weights=DEFAULT_WEIGHTS):
+        """Same (indices, scores) result as calculate_career_matches_batch"""
+        k = min(top_k, self.catalog.size)
+        chunks = [user_profiles[start:start + chunk_size] for start in range(0, len(user_profiles), chunk_size)]
+        shards = max(1, min(self.workers // max(len(chunks), 1), self.catalog.size // MIN_SHARD_ROWS))
+        bounds = np.linspace(0, self.catalog.size, shards + 1).astype(int)
+
+        tasks = [(chunk, start, stop, k, weights) for chunk in chunks for start, stop in zip(bounds[:-1], bounds[1:])]
+        results = self.pool.imap(_match_shard, tasks)
+
+        indices = np.empty((len(user_profiles), k), dtype=np.intp)
+        scores = np.empty((len(user_profiles), k), dtype=int)
+        row = 0
+        for chunk in chunks:
+            parts = [next(results) for _ in range(shards)]
+            # Shards are in catalog order, so column order breaks ties the same way a full scan does
+            chunk_indices = np.hstack([part[0] for part in parts])
+            chunk_scores = np.hstack([part[1] for part in parts])
+            best = top_k_rows(chunk_scores, k)
+            indices[row:row + len(chunk)] = np.take_along_axis(chunk_indices, best, axis=1)
+            scores[row:row + len(chunk)] = np.take_along_axis(chunk_scores, best, axis=1)
+            row += len(chunk)
+        return indices, scores
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        self.pool.close()
+        self.pool.join()
+        self.shared.close(unlink=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
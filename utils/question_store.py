@@ -0,0 +1,58 @@
+import json
+import os
+
+from data.riasec_questions import riasec_questions
+from utils.catalog_ingest import normalize_question
+from utils.file_store import ReloadingFile, atomic_write
+
+DEFAULT_QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'riasec_questions.jsonl')
+
+def questions_path():
+    return os.getenv('RIASEC_QUESTIONS_PATH') or DEFAULT_QUESTIONS_PATH
+
+
+def validate_questions(questions):
+    """Normalized question list, checked for duplicate ids"""
+    questions = [normalize_question(question) for question in questions]
+    if not questions:
+        raise ValueError("no questions")
+    seen = set()
+    for question in questions:
+        if question['id'] in seen:
+            raise ValueError(f"question id {question['id']!r} is used more than once")
+        seen.add(question['id'])
+    return questions
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        return validate_questions(json.loads(line) for line in f if line.strip())
+
+
+_questions_file = ReloadingFile(questions_path, _load, riasec_questions)
+
+
+def get_questions():
+    """RIASEC questions saved in the admin panel, else data.riasec_questions
+
+    The file is re-read whenever it changes; the same list is returned until
+    then, so the compiled question bank is reused.
+    """
+    return _questions_file.get()
+
+
+def save_questions(questions):
+    """Replace the RIASEC questions; sessions use them from their next page load"""
+    questions = validate_questions(questions)
+    with atomic_write(questions_path(), prefix='.questions-', suffix='.jsonl') as f:
+        for question in questions:
+            f.write(json.dumps(question) + '\n')
+    return questions
+
+
+def reset_questions():
+    """Drop saved questions so data.riasec_questions applies again"""
+    try:
+        os.remove(questions_path())
+    except FileNotFoundError:
+        pass
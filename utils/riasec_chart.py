@@ -0,0 +1,37 @@
+import os
+
+import plotly.graph_objects as go
+
+from utils.match_cache import LRUCache
+
+# Layout shared by every radar figure, so building one only validates its trace
+RADAR_LAYOUT = go.Layout(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 5]
+        )),
+    showlegend=False,
+    height=400
+)
+
+# Radar figures by RIASEC score vector; reruns of an unchanged profile reuse the figure
+radar_cache = LRUCache(int(os.getenv('RADAR_CACHE_SIZE', '256')))
+
+
+def radar_figure(riasec_scores):
+    """Radar chart of a RIASEC profile, shared between reruns and sessions, so treat it as read-only"""
+    key = tuple(riasec_scores.items())
+    figure = radar_cache.get(key)
+    if figure is None:
+        figure = go.Figure(
+            data=[go.Scatterpolar(
+                r=[score for _, score in key],
+                theta=[cat.capitalize() for cat, _ in key],
+                fill='toself',
+                name='Your Profile'
+            )],
+            layout=RADAR_LAYOUT
+        )
+        radar_cache.put(key, figure)
+    return figure
@@ -0,0 +1,77 @@
+import numpy as np
+
+from utils.question_store import get_questions
+from utils.scoring_engine import RIASEC_TYPES
+
+# Rating scale of the assessment; unanswered questions count as NEUTRAL_RATING
+MIN_RATING = 1
+MAX_RATING = 5
+NEUTRAL_RATING = 3
+
+
+class QuestionBank:
+    """RIASEC question bank compiled to index arrays for vectorized scoring
+
+    Each question becomes its RIASEC type column and a reverse-keyed flag,
+    so the six scale scores of any number of answer sets are one matrix
+    product normalised by the true number of questions per type.
+    """
+
+    def __init__(self, questions):
+        self.questions = questions
+        self.ids = [question['id'] for question in questions]
+        unknown = {question['type'] for question in questions} - set(RIASEC_TYPES)
+        if unknown:
+            raise ValueError(f"questions have unknown RIASEC types: {', '.join(sorted(unknown))}")
+        self.type_index = np.array([RIASEC_TYPES.index(question['type']) for question in questions], dtype=np.intp)
+        self.reverse = np.array([bool(question.get('reverse')) for question in questions], dtype=bool)
+        self.type_counts = np.bincount(self.type_index, minlength=len(RIASEC_TYPES)).astype(float)
+        self._divisors = np.where(self.type_counts > 0, self.type_counts, 1)
+
+        # Per-type rating sums are ratings @ signs + offsets: a reverse-keyed
+        # rating r counts as MIN_RATING + MAX_RATING - r
+        self.signs = np.zeros((len(questions), len(RIASEC_TYPES)))
+        self.signs[np.arange(len(questions)), self.type_index] = np.where(self.reverse, -1, 1)
+        self.offsets = np.bincount(
+            self.type_index, weights=self.reverse * float(MIN_RATING + MAX_RATING), minlength=len(RIASEC_TYPES)
+        )
+
+    def ratings(self, answers):
+        """Answer ratings aligned with the questions, NEUTRAL_RATING where unanswered"""
+        return np.fromiter((answers.get(id_, NEUTRAL_RATING) for id_ in self.ids), dtype=float, count=len(self.ids))
+
+    def score(self, answers):
+        """Average keyed rating per RIASEC type (0-5 scale) for one answer dict"""
+        scores = (self.ratings(answers) @ self.signs + self.offsets) / self._divisors
+        # Plain floats, so scores can be stored and hashed as JSON
+        return dict(zip(RIASEC_TYPES, scores.tolist()))
+
+    def score_ratings(self, ratings):
+        """RIASEC scores of an answer sets x questions ratings matrix as an answer sets x 6 matrix"""
+        return (np.asarray(ratings, dtype=float) @ self.signs + self.offsets) / self._divisors
+
+    def score_batch(self, answer_sets):
+        """RIASEC scores of many answer dicts as an answer sets x 6 matrix"""
+        ratings = np.array([self.ratings(answers) for answers in answer_sets]).reshape(-1, len(self.ids))
+        return self.score_ratings(ratings)
+
+
+_question_bank = None
+
+
+def get_question_bank(questions=None):
+    """Compiled question bank, rebuilt when a different question list is passed
+
+    Defaults to the questions in use (see utils.question_store).
+    """
+    global _question_bank
+    if questions is None:
+        questions = get_questions()
+    if _question_bank is None or _question_bank.questions is not questions:
+        _question_bank = QuestionBank(questions)
+    return _question_bank
+
+
+def calculate_riasec_scores(answers, questions=None):
+    """Average rating per RIASEC type (0-5 scale); unanswered questions count as 3"""
+    return get_question_bank(questions).score(answers)
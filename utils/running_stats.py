@@ -0,0 +1,45 @@
+import math
+
+
+class RunningStats:
+    """Count, mean and variance of a stream of numbers without keeping the numbers
+
+    add() is Welford's update; merge() combines two summaries as if their
+    streams had been concatenated (Chan et al.), so per-batch or
+    per-organization summaries can be kept apart and pooled on read.
+    """
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        """Fold other into this summary and return it"""
+        if other.count:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+            self.count = count
+        return self
+
+    @property
+    def variance(self):
+        """Population variance (0 when empty)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def __repr__(self):
+        return f"RunningStats(count={self.count}, mean={self.mean:.4g}, std={self.std:.4g})"
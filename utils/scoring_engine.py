@@ -0,0 +1,426 @@
+from collections import namedtuple
+
+import numpy as np
+
+from utils.career_facets import CareerFacets
+from utils.interning import encode_skill_levels, skill_registry, value_registry
+from utils.skill_normalizer import skill_normalizer
+
+RIASEC_TYPES = ['realistic', 'investigative', 'artistic', 'social', 'enterprising', 'conventional']
+
+# Keywords searched for in a career's work environment for each work value
+VALUE_KEYWORDS = {
+    'Work-Life Balance': ['flexible', 'balance', 'remote'],
+    'Job Security': ['stable', 'secure', 'established'],
+    'High Earnings': ['high salary', 'lucrative', 'well-paid'],
+    'Helping Others': ['help', 'serve', 'support', 'care'],
+    'Creativity': ['creative', 'innovative', 'design'],
+    'Leadership': ['lead', 'manage', 'direct'],
+    'Continuous Learning': ['learn', 'grow', 'develop'],
+    'Recognition': ['recognition', 'prestige', 'respected']
+}
+
+# Default component weights (out of 100)
+RIASEC_WEIGHT = 40
+SKILLS_WEIGHT = 35
+VALUES_WEIGHT = 25
+
+PRIMARY_SHARE = 0.7
+SECONDARY_SHARE = 0.3
+
+# Points per component (summing to 100) and the primary/secondary split of the RIASEC points
+ScoringWeights = namedtuple('ScoringWeights', ['riasec', 'skills', 'values', 'primary_share', 'secondary_share'])
+
+DEFAULT_WEIGHTS = ScoringWeights(RIASEC_WEIGHT, SKILLS_WEIGHT, VALUES_WEIGHT, PRIMARY_SHARE, SECONDARY_SHARE)
+
+
+def round_scores(scores):
+    """Round raw weighted scores to whole percentages
+
+    Scores are snapped to 9 decimals first so float noise from different
+    summation orders (single vs batch scoring) never flips a .5 rounding.
+    """
+    return np.round(np.round(scores, 9)).astype(int)
+
+
+def combine_fits(fits, weights=DEFAULT_WEIGHTS):
+    """(riasec, skills, values) weighted points per career from score_fits() output"""
+    primary_fit, secondary_fit, skills_fit, values_fit = fits
+    riasec_score = (primary_fit * weights.primary_share + secondary_fit * weights.secondary_share) / 5 * weights.riasec
+    return np.array([riasec_score, skills_fit * weights.skills, values_fit * weights.values])
+
+
+def top_k_indices(scores, k=10):
+    """Indices of the k highest scores, ties broken by catalog order"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Partial selection finds the k-th best score; only candidates reaching it are sorted
+    threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+    candidates = np.flatnonzero(scores >= threshold)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order[:k]]
+
+
+def top_k_rows(scores, k=10):
+    """Row-wise top_k_indices for a profiles x careers matrix of integer scores"""
+    n = scores.shape[1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty((len(scores), 0), dtype=np.intp)
+
+    # Fold the catalog index into the key so ties keep catalog order
+    keys = scores.astype(np.int64) * n + (n - 1 - np.arange(n))
+    picked = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(keys, picked, axis=1), axis=1)
+    return np.take_along_axis(picked, order, axis=1)
+
+
+class CompiledCatalog:
+    """Dense matrix form of a career store used for vectorized scoring
+
+    Skill and value columns are registry IDs (see utils.interning), so
+    encoded profiles index straight into the matrices.
+    """
+
+    # Matrices saved with a catalog file's cache (see utils.catalog_loader)
+    MATRICES = ('primary', 'secondary', 'skill_counts', 'skill_matrix', 'value_matrix')
+
+    def __init__(self, careers, version=0, source=None, matrices=None):
+        # careers is a CareerStore; source is the data.careers list it was built from.
+        # matrices holds already compiled MATRICES for careers (see from_arrays).
+        self.careers = careers
+        self.source = source
+        self.version = version
+        self.size = len(careers)
+
+        # Required skills as registry IDs: skill_ids[skill_offsets[i]:skill_offsets[i + 1]]
+        self.skill_offsets = careers.skill_offsets
+        self.skill_ids = careers.skill_ids
+
+        # Assessed skills each registered skill maps to (see utils.skill_normalizer)
+        registry_width = len(skill_registry)
+        self.skill_map = skill_normalizer.table(registry_width)
+        self.skill_map_owners = np.repeat(np.arange(registry_width), np.diff(self.skill_map[0]))
+
+        for name, matrix in (matrices or self._compile(careers)).items():
+            setattr(self, name, matrix)
+        self.skill_width = self.skill_matrix.shape[1]
+        self.value_width = self.value_matrix.shape[1]
+        self._facets = None
+
+    def _compile(self, careers):
+        """MATRICES built from the career store's columns"""
+        # RIASEC one-hots (a career with an unknown type gets an all-zero row)
+        primary = self._one_hot(careers.primary_types)
+        secondary = self._one_hot(careers.secondary_types)
+        skill_counts = np.diff(self.skill_offsets).astype(float)
+
+        # Career x value matches (1 where a value's keywords appear in the
+        # career's work environment), matched once per distinct environment string
+        value_columns = [(value_registry.intern(name), keywords) for name, keywords in VALUE_KEYWORDS.items()]
+        value_width = len(value_registry)
+        environments = careers.work_environments
+        environment_matches = np.zeros((len(environments.table), value_width), dtype=bool)
+        for code, environment in enumerate(environments.table):
+            environment = environment.lower()
+            for col, keywords in value_columns:
+                if any(keyword in environment for keyword in keywords):
+                    environment_matches[code, col] = True
+        environment_rows = np.repeat(np.arange(self.size), np.diff(environments.offsets))
+        entries, cols = np.nonzero(environment_matches[environments.codes])
+        value_matrix = np.zeros((self.size, value_width))
+        value_matrix[environment_rows[entries], cols] = 1
+
+        # Career x assessed skill weights: each required skill spreads at most 1
+        # over the assessed skills it maps to (see utils.skill_normalizer).
+        # Catalog-only skills never get a column of their own.
+        map_offsets, map_ids, map_weights = self.skill_map
+        fanout = np.diff(map_offsets)[self.skill_ids]
+        entries = np.arange(fanout.sum()) - np.repeat(np.cumsum(fanout) - fanout, fanout) + np.repeat(map_offsets[self.skill_ids], fanout)
+        skill_rows = np.repeat(np.repeat(np.arange(self.size), np.diff(self.skill_offsets)), fanout)
+        skill_matrix = np.zeros((self.size, skill_normalizer.assessed_width))
+        np.add.at(skill_matrix, (skill_rows, map_ids[entries]), map_weights[entries])
+
+        return {
+            'primary': primary,
+            'secondary': secondary,
+            'skill_counts': skill_counts,
+            'skill_matrix': skill_matrix,
+            'value_matrix': value_matrix
+        }
+
+    def to_arrays(self):
+        """MATRICES plus the skill and value names of their columns, as a flat name -> array dict"""
+        from utils.career_store import StringColumn
+
+        arrays = {name: getattr(self, name) for name in self.MATRICES}
+        arrays.update(StringColumn.from_strings(map(skill_registry.name, range(self.skill_width))).to_arrays('skill_columns'))
+        arrays.update(StringColumn.from_strings(map(value_registry.name, range(self.value_width))).to_arrays('value_columns'))
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, careers, arrays, version=0, source=None):
+        """Catalog over careers using to_arrays() output, e.g. memory-mapped from a cache
+
+        The matrices are recompiled if their columns are not this process's
+        registry IDs for the same skills and values.
+        """
+        from utils.career_store import StringColumn
+
+        for registry, prefix in ((skill_registry, 'skill_columns'), (value_registry, 'value_columns')):
+            names = StringColumn.from_arrays(arrays, prefix)
+            if any(registry.id(name) != id_ for id_, name in enumerate(names)):
+                return cls(careers, version, source)
+        return cls(careers, version, source, {name: arrays[name] for name in cls.MATRICES})
+
+    def _one_hot(self, types):
+        """One-hot RIASEC rows for a categorical type column"""
+        # Trailing -1 maps missing (code -1) types to no column
+        type_cols = np.array([RIASEC_TYPES.index(name) if name in RIASEC_TYPES else -1 for name in types.table] + [-1])
+        cols = type_cols[types.codes]
+        one_hot = np.zeros((self.size, len(RIASEC_TYPES)))
+        rows = np.flatnonzero(cols >= 0)
+        one_hot[rows, cols[rows]] = 1
+        return one_hot
+
+    def riasec_vector(self, riasec_scores):
+        """Profile RIASEC scores as a vector aligned with RIASEC_TYPES"""
+        return np.array([riasec_scores.get(type_name, 0) for type_name in RIASEC_TYPES], dtype=float)
+
+    def skills_vector(self, skills_confidence):
+        """Profile skill confidence (0-1) aligned with the catalog's skill columns"""
+        ids, levels = encode_skill_levels(skills_confidence)
+        known = (ids >= 0) & (ids < self.skill_width)
+        vector = np.zeros(self.skill_width)
+        vector[ids[known]] = levels[known] / 5
+        return vector
+
+    def value_ids(self, work_values):
+        """Registry IDs of the selected work values known to this catalog"""
+        ids = value_registry.lookup(work_values)
+        return ids[(ids >= 0) & (ids < self.value_width)]
+
+    def values_vector(self, work_values):
+        """Selection counts for each known work value"""
+        return np.bincount(self.value_ids(work_values), minlength=self.value_width).astype(float)
+
+    def matched_values(self, work_values, rows=None):
+        """Number of selected work values found in each career's environment
+
+        A value selected more than once counts once per selection.
+        """
+        value_matrix = self.value_matrix if rows is None else self.value_matrix[rows]
+        return value_matrix @ self.values_vector(work_values)
+
+    @property
+    def facets(self):
+        """Parsed salary, growth and education columns for filtering (built on first use)"""
+        if self._facets is None:
+            self._facets = CareerFacets(self.careers)
+        return self._facets
+
+    def score(self, user_profile, rows=None, weights=DEFAULT_WEIGHTS):
+        """Weighted match score (0-100) of every career, or only the given rows, for one profile"""
+        riasec_score, skills_score, values_score = self.score_components(user_profile, rows, weights)
+        return riasec_score + skills_score + values_score
+
+    def score_components(self, user_profile, rows=None, weights=DEFAULT_WEIGHTS):
+        """(riasec, skills, values) weighted points per career as a 3 x careers array"""
+        return combine_fits(self.score_fits(user_profile, rows), weights)
+
+    def score_fits(self, user_profile, rows=None):
+        """Unweighted component fits per career as a 4 x careers array
+
+        Rows are the primary and secondary type's RIASEC score (0-5) and the
+        skills and values fits (0-1); combine_fits() weights them, so other
+        weights only need a re-combine.
+        """
+        if rows is None:
+            primary, secondary = self.primary, self.secondary
+            skill_matrix, skill_counts = self.skill_matrix, self.skill_counts
+        else:
+            primary, secondary = self.primary[rows], self.secondary[rows]
+            skill_matrix, skill_counts = self.skill_matrix[rows], self.skill_counts[rows]
+
+        riasec = self.riasec_vector(user_profile['riasecScores'])
+
+        skills_fit = np.zeros(len(primary))
+        if user_profile['skillsConfidence']:
+            matched_skills = skill_matrix @ self.skills_vector(user_profile['skillsConfidence'])
+            np.divide(matched_skills, skill_counts, out=skills_fit, where=skill_counts > 0)
+
+        values_fit = np.zeros(len(primary))
+        if user_profile['workValues']:
+            values_fit = self.matched_values(user_profile['workValues'], rows) / len(user_profile['workValues'])
+
+        return np.array([primary @ riasec, secondary @ riasec, skills_fit, values_fit])
+
+    def breakdown(self, user_profile, rows, components, weights=DEFAULT_WEIGHTS):
+        """Score breakdown dicts for catalog rows, from their columns of score_components()"""
+        rows = np.asarray(rows, dtype=np.intp)
+        skills = self.skills_vector(user_profile['skillsConfidence'])
+
+        # Skill IDs that map to at least one rated assessed skill
+        rated = set(self.skill_map_owners[skills[self.skill_map[1]] > 0].tolist())
+        bounds = zip(self.skill_offsets[rows].tolist(), self.skill_offsets[rows + 1].tolist())
+
+        # Selected values (first selection order) found in each row's environment
+        selected = list(dict.fromkeys(user_profile['workValues']))
+        ids = value_registry.lookup(selected)
+        known = (ids >= 0) & (ids < self.value_width)
+        selected = [value for value, ok in zip(selected, known) if ok]
+        ids = ids[known]
+        value_hits = self.value_matrix[rows][:, ids]
+
+        # Snapped like round_scores so float noise never flips a rounding
+        points = np.round(np.round(components, 9), 1).T.tolist()
+
+        breakdowns = []
+        for (start, stop), (riasec_points, skills_points, values_points), hits in zip(bounds, points, value_hits.tolist()):
+            matched_skills = dict.fromkeys(id_ for id_ in self.skill_ids[start:stop].tolist() if id_ in rated)
+            breakdowns.append({
+                'riasec': riasec_points,
+                'skills': skills_points,
+                'values': values_points,
+                'matchedSkills': [skill_registry.name(id_) for id_ in matched_skills],
+                'matchedValues': [value for value, hit in zip(selected, hits) if hit],
+                'weights': {'riasec': weights.riasec, 'skills': weights.skills, 'values': weights.values}
+            })
+        return breakdowns
+
+    def encode_batch(self, user_profiles):
+        """(riasec, skills, values, value_totals) profile matrices for score_encoded"""
+        riasec = np.array([self.riasec_vector(p['riasecScores']) for p in user_profiles]).reshape(-1, len(RIASEC_TYPES))
+        skills = np.array([self.skills_vector(p['skillsConfidence']) for p in user_profiles]).reshape(-1, self.skill_width)
+        values = np.array([self.values_vector(p['workValues']) for p in user_profiles]).reshape(-1, self.value_width)
+        value_totals = np.array([len(p['workValues']) for p in user_profiles], dtype=float)
+        return riasec, skills, values, value_totals
+
+    def score_batch(self, user_profiles, weights=DEFAULT_WEIGHTS):
+        """Weighted match scores as a profiles x careers matrix"""
+        return self.score_encoded(*self.encode_batch(user_profiles), weights)
+
+    def score_encoded(self, riasec, skills, values, value_totals, weights=DEFAULT_WEIGHTS):
+        """Weighted match scores of encoded profiles as a profiles x careers matrix"""
+        # RIASEC matching
+        riasec_score = (riasec @ self.primary.T * weights.primary_share + riasec @ self.secondary.T * weights.secondary_share) / 5 * weights.riasec
+
+        # Skills matching
+        skills_score = np.zeros_like(riasec_score)
+        np.divide(skills @ self.skill_matrix.T, self.skill_counts, out=skills_score, where=self.skill_counts > 0)
+        skills_score *= weights.skills
+
+        # Work values matching
+        values_score = np.zeros_like(riasec_score)
+        np.divide(values @ self.value_matrix.T, value_totals[:, None], out=values_score, where=value_totals[:, None] > 0)
+        values_score *= weights.values
+
+        return riasec_score + skills_score + values_score
+
+
+class IncrementalScorer:
+    """Per-career score components for one profile, updated one input at a time
+
+    Each change (a RIASEC score, a skill confidence or the work values)
+    adjusts only its own component by the delta of the changed input, so
+    re-ranking after a what-if tweak costs a few vector operations.
+    """
+
+    def __init__(self, catalog, user_profile, weights=DEFAULT_WEIGHTS):
+        self.catalog = catalog
+        self.weights = weights
+        self.riasec_scores = dict(user_profile['riasecScores'])
+        self.skills_confidence = dict(user_profile['skillsConfidence'])
+        self.work_values = list(user_profile['workValues'])
+
+        riasec = catalog.riasec_vector(self.riasec_scores)
+        self.primary_fit = catalog.primary @ riasec
+        self.secondary_fit = catalog.secondary @ riasec
+        self.matched_skills = catalog.skill_matrix @ catalog.skills_vector(self.skills_confidence)
+        self.matched_values = catalog.value_matrix @ catalog.values_vector(self.work_values)
+
+    def set_riasec(self, type_name, score):
+        """Change one RIASEC scale score"""
+        delta = score - self.riasec_scores.get(type_name, 0)
+        self.riasec_scores[type_name] = score
+        if delta and type_name in RIASEC_TYPES:
+            col = RIASEC_TYPES.index(type_name)
+            self.primary_fit += self.catalog.primary[:, col] * delta
+            self.secondary_fit += self.catalog.secondary[:, col] * delta
+
+    def set_skill(self, skill, confidence):
+        """Change one skill confidence (1-5)"""
+        delta = confidence - self.skills_confidence.get(skill, 0)
+        self.skills_confidence[skill] = confidence
+        col = skill_registry.id(skill)
+        if delta and col is not None and col < self.catalog.skill_width:
+            self.matched_skills += self.catalog.skill_matrix[:, col] * (delta / 5)
+
+    def set_work_values(self, work_values):
+        """Replace the selected work values, e.g. swapping one for another"""
+        delta = self.catalog.values_vector(work_values) - self.catalog.values_vector(self.work_values)
+        self.work_values = list(work_values)
+        for col in np.flatnonzero(delta):
+            self.matched_values += self.catalog.value_matrix[:, col] * delta[col]
+
+    def score(self):
+        """Weighted match score (0-100) of every career for the current inputs"""
+        riasec_score, skills_score, values_score = self.score_components()
+        return riasec_score + skills_score + values_score
+
+    def score_components(self):
+        """(riasec, skills, values) weighted points per career as a 3 x careers array"""
+        skills_fit = np.zeros(self.catalog.size)
+        if self.skills_confidence:
+            np.divide(self.matched_skills, self.catalog.skill_counts, out=skills_fit, where=self.catalog.skill_counts > 0)
+
+        values_fit = np.zeros(self.catalog.size)
+        if self.work_values:
+            values_fit = self.matched_values / len(self.work_values)
+
+        return combine_fits((self.primary_fit, self.secondary_fit, skills_fit, values_fit), self.weights)
+
+    def profile(self):
+        """The scorer's current inputs in user profile form"""
+        return {'riasecScores': self.riasec_scores, 'skillsConfidence': self.skills_confidence, 'workValues': self.work_values}
+
+
+_compiled_catalog = None
+_catalog_version = 0
+
+
+def get_compiled_catalog():
+    """Return the compiled career catalog, compiling it on first use
+
+    The catalog is the file named by CAREER_CATALOG_PATH, else the catalog
+    saved by the admin panel, else data.careers. Catalog files are reloaded
+    when they change.
+    """
+    global _compiled_catalog, _catalog_version
+    from utils.career_store import CareerStore
+    from utils.catalog_loader import catalog_path, load_catalog, load_compiled_catalog
+
+    path = catalog_path()
+    if path:
+        source = load_catalog(path)
+    else:
+        from data.careers import careers as source
+
+    if _compiled_catalog is None or _compiled_catalog.source is not source:
+        # Every compile gets a new version so results cached against the old catalog go stale
+        _catalog_version += 1
+        if path:
+            # Catalog files come with their matrices already compiled in the cache
+            _compiled_catalog = load_compiled_catalog(path, _catalog_version)
+        else:
+            store = source if isinstance(source, CareerStore) else CareerStore.from_records(source)
+            _compiled_catalog = CompiledCatalog(store, _catalog_version, source=source)
+    return _compiled_catalog
+
+
+def invalidate_compiled_catalog():
+    """Drop the compiled catalog after data.careers is modified in place"""
+    global _compiled_catalog
+    _compiled_catalog = None
@@ -0,0 +1,94 @@
+import json
+import logging
+import os
+
+from utils.file_store import ReloadingFile, atomic_write
+from utils.scoring_engine import DEFAULT_WEIGHTS, ScoringWeights
+
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'scoring_weights.json')
+
+# Tenant whose weights apply to tenants without their own
+DEFAULT_TENANT = 'default'
+
+logger = logging.getLogger(__name__)
+
+
+def weights_path():
+    return os.getenv('SCORING_WEIGHTS_PATH') or DEFAULT_WEIGHTS_PATH
+
+
+def validate_weights(weights):
+    """ScoringWeights from a ScoringWeights, list or dict, checked for consistency"""
+    if isinstance(weights, dict):
+        weights = [weights.get(field) for field in ScoringWeights._fields]
+    if len(weights) != len(ScoringWeights._fields):
+        raise ValueError(f"weights need {len(ScoringWeights._fields)} values")
+    try:
+        weights = ScoringWeights(*(float(value) for value in weights))
+    except (TypeError, ValueError):
+        raise ValueError("weights must be numbers")
+    if min(weights) < 0:
+        raise ValueError("weights can't be negative")
+    if abs(weights.riasec + weights.skills + weights.values - 100) > 1e-6:
+        raise ValueError("component weights must add up to 100")
+    if abs(weights.primary_share + weights.secondary_share - 1) > 1e-6:
+        raise ValueError("primary and secondary shares must add up to 1")
+    return weights
+
+
+def _load(path):
+    """tenant -> ScoringWeights from the weights file
+
+    A file that can't be read or holds invalid weights is logged and
+    ignored, so matching falls back to the built-in weights rather than
+    failing every page.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return {tenant: validate_weights(weights) for tenant, weights in json.load(f).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        logger.exception("Ignoring unreadable scoring weights file %s", path)
+        return {}
+
+
+_weights_file = ReloadingFile(weights_path, _load, {})
+
+
+def _tenants():
+    """tenant -> ScoringWeights, re-read whenever the file changes"""
+    return _weights_file.get()
+
+
+def get_weights(tenant=None):
+    """Scoring weights for tenant, falling back to the default tenant's and then the built-in weights"""
+    tenants = _tenants()
+    return tenants.get(tenant) or tenants.get(DEFAULT_TENANT) or DEFAULT_WEIGHTS
+
+
+def list_tenants():
+    """Tenants with their own weights"""
+    return sorted(_tenants())
+
+
+def _save(tenants):
+    with atomic_write(weights_path(), prefix='.weights-', suffix='.json') as f:
+        json.dump({tenant: weights._asdict() for tenant, weights in tenants.items()}, f, indent=2)
+
+
+def set_weights(tenant, weights):
+    """Store tenant's weights; sessions pick them up on their next match"""
+    weights = validate_weights(weights)
+    # Held across the read-modify-write so concurrent saves don't drop each other's tenants
+    with _weights_file.lock:
+        tenants = dict(_tenants())
+        tenants[tenant] = weights
+        _save(tenants)
+    return weights
+
+
+def reset_weights(tenant):
+    """Drop tenant's own weights so the fallback applies again"""
+    with _weights_file.lock:
+        tenants = dict(_tenants())
+        if tenants.pop(tenant, None) is not None:
+            _save(tenants)
@@ -1,5 +1,10 @@
+import os
+import uuid
+
 import streamlit as st
 
+from utils.assessment_history import AssessmentHistory
+
 def init_session_state():
     """Initialize all session state variables"""
     
@@ -14,6 +19,14 @@ def init_session_state():
     if 'selected_persona' not in st.session_state:
         st.session_state.selected_persona = None
     
+    # Identifies this session's assessments in the assessment store
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    
+    # Tenant whose scoring weights apply to this session
+    if 'tenant' not in st.session_state:
+        st.session_state.tenant = os.getenv('TENANT', 'default')
+    
     # User profile
     if 'user_profile' not in st.session_state:
         st.session_state.user_profile = {
@@ -57,4 +70,4 @@ def init_session_state():
     
     # Store assessment data for analytics
     if 'assessment_history' not in st.session_state:
-        st.session_state.assessment_history = []
+        st.session_state.assessment_history = AssessmentHistory()
@@ -0,0 +1,131 @@
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+from data.skill_synonyms import skill_synonyms
+from data.skills_list import skills_categories
+from utils.interning import skill_registry
+
+# Smallest trigram (Dice) similarity at which an unlisted skill maps to an assessed one
+MIN_SIMILARITY = 0.6
+
+# Assessed skills an unlisted skill can map to by similarity
+MAX_SIMILAR = 2
+
+
+def normalize_skill(name):
+    """Lowercase skill name with punctuation and repeated spaces removed"""
+    name = name.lower().replace('&', ' and ')
+    return ' '.join(re.sub(r'[^a-z0-9+#]+', ' ', name).split())
+
+
+def trigrams(name):
+    """Character trigrams of a normalized name, padded so word edges count"""
+    padded = f'  {name} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a, b):
+    """Trigram (Dice) similarity of two normalized names"""
+    if a == b:
+        return 1.0
+    a, b = trigrams(a), trigrams(b)
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class SkillNormalizer:
+    """Maps catalog skill names onto the assessed skills they draw on
+
+    An assessed skill maps to itself. Other names are looked up in the
+    synonym table, then matched by character trigram similarity against
+    the assessed skills; the weights of one name add up to at most 1.
+    A similar assessed skill must also share a word with the name that
+    sets it apart from the other assessed skills, or appear in the name
+    whole, so a shared generic word ('management') is not enough.
+    Each skill registry ID is resolved once and kept in CSR arrays, so
+    compiling a catalog only gathers integers.
+    """
+
+    def __init__(self, assessed, synonyms, registry=skill_registry):
+        self.registry = registry
+        self.assessed_ids = {normalize_skill(name): registry.intern(name) for name in assessed}
+        # Every name maps to IDs below this, so assessed-skill columns stop here
+        self.assessed_width = max(self.assessed_ids.values(), default=-1) + 1
+        self.synonyms = {
+            normalize_skill(name): [(self.assessed_ids[normalize_skill(target)], weight) for target, weight in targets.items()]
+            for name, targets in synonyms.items()
+        }
+
+        # Words of each assessed skill; words in several of them (e.g. 'management') don't tell them apart
+        self._words = {id_: name.split() for name, id_ in self.assessed_ids.items()}
+        word_counts = Counter(word for words in self._words.values() for word in set(words))
+        self._generic = {word for word, count in word_counts.items() if count > 1}
+
+        # Trigram -> assessed skills containing it
+        self._grams = {}
+        self._gram_counts = {}
+        for name, id_ in self.assessed_ids.items():
+            grams = trigrams(name)
+            self._gram_counts[id_] = len(grams)
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(id_)
+
+        self._lock = threading.Lock()
+        self._offsets = [0]
+        self._ids = []
+        self._weights = []
+        self._arrays = None
+
+    def resolve(self, name):
+        """[(assessed skill ID, weight)] that name stands for"""
+        key = normalize_skill(name)
+        if key in self.assessed_ids:
+            return [(self.assessed_ids[key], 1.0)]
+        if key in self.synonyms:
+            return list(self.synonyms[key])
+
+        grams = trigrams(key)
+        shared = Counter(id_ for gram in grams for id_ in self._grams.get(gram, ()))
+        similar = sorted(
+            ((2 * count / (len(grams) + self._gram_counts[id_]), id_) for id_, count in shared.items()),
+            key=lambda item: (-item[0], item[1])
+        )
+        similar = [(score, id_) for score, id_ in similar if score >= MIN_SIMILARITY and self._overlaps(key, id_)]
+        matches = [(id_, score) for score, id_ in similar[:MAX_SIMILAR]]
+        total = sum(weight for _, weight in matches)
+        return [(id_, weight / total) for id_, weight in matches] if total > 1 else matches
+
+    def _overlaps(self, key, id_):
+        """Whether name key shares a distinguishing word with assessed skill id_, or contains all its words
+
+        Words match when they are similar, so misspellings still count.
+        """
+        words = key.split()
+        matched = [word for word in self._words[id_] if any(similarity(word, other) >= MIN_SIMILARITY for other in words)]
+        return len(matched) == len(self._words[id_]) or any(word not in self._generic for word in matched)
+
+    def table(self, width):
+        """(offsets, ids, weights) CSR arrays mapping skill IDs below width to assessed skill IDs"""
+        with self._lock:
+            if len(self._offsets) <= width:
+                for id_ in range(len(self._offsets) - 1, width):
+                    for target, weight in self.resolve(self.registry.name(id_)):
+                        self._ids.append(target)
+                        self._weights.append(weight)
+                    self._offsets.append(len(self._ids))
+                self._arrays = None
+            if self._arrays is None:
+                self._arrays = (
+                    np.array(self._offsets, dtype=np.int64),
+                    np.array(self._ids, dtype=np.int32),
+                    np.array(self._weights, dtype=float)
+                )
+            offsets, ids, weights = self._arrays
+        return offsets[:width + 1], ids[:offsets[width]], weights[:offsets[width]]
+
+
+skill_normalizer = SkillNormalizer(
+    (skill for category in skills_categories for skill in category['skills']), skill_synonyms
+)